@@ -78,7 +78,7 @@ class ShortTermMemory(BaseMemory):
             metadata=metadata or {}
         )
         self._conversation_log.append(entry)
-        logger.debug(f"Recorded conversation turn: {key[:50]}...")
+        logger.debug("Recorded conversation turn: %s...", key[:50])
         return True
 
     def get(self, key: str) -> Optional[Any]:
@@ -13,9 +13,8 @@ def fetch_tool() -> str:
 
     Workflow:
         1. Instantiate DataFetcher.
-        2. Fetch data from the URL.
-        3. Store fetched data internally.
-        4. Save data to disk using Files Helper Repositories.
+        2. Stream data from the URLs directly to disk.
+        3. Merge generated synthetic logs into the fetched logs.
 
     Returns: output paths for fetched data in this form
         dict: {
@@ -1,7 +0,0 @@
-from .processor import Preprocessor
-from .source_connector import DataFetcher
-
-__all__ = [
-    Preprocessor,
-    DataFetcher
-]
\ No newline at end of file
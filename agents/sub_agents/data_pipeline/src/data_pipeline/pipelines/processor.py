@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 from utils import logger, get_config
 from utils import TimestampHelper
 from utils import JsonlRepository, JsonRepository, IcsRepository
@@ -25,6 +27,7 @@ class Preprocessor:
         self.ics_repo = IcsRepository(self.ics_path)
         self.ics_repo.ensure_exists()
         self.ics_data = self.ics_repo.read_all()
+        self._ics_ranges = None  # parsed lazily by _event_ranges
 
         self.processed_sessions = []
 
@@ -47,30 +50,52 @@ class Preprocessor:
         Remove redundant logs and track redundancy count per UID.
         Keep only earliest timestamp for each UID.
         """
-        total_redundant = 0
-
-        for record in data:
-            logs = record.get("logs", [])
-            uid_map = {}
-            redundant_count = {}
-
-            for log in logs:
-                uid = log.get("uid")
-                ts = log.get("ts")
-
-                if uid not in uid_map:
-                    uid_map[uid] = log
-                else:
-                    redundant_count[uid] = redundant_count.get(uid, 0) + 1
-
-                    # Keep earliest timestamp
-                    if ts < uid_map[uid]["ts"]:
-                        redundant_count[uid] += 1
-                        uid_map[uid] = log
-
-            record["logs"] = list(uid_map.values())
-            record["redundant_uids"] = redundant_count
-            total_redundant += sum(redundant_count.values())
+        all_logs = [log for record in data for log in record.get("logs", [])]
+        df = pd.DataFrame.from_records(all_logs, columns=["uid", "ts"])
+        df["record"] = np.repeat(np.arange(len(data)), [len(record.get("logs", [])) for record in data])
+        df["position"] = np.arange(len(df))
+
+        # Work on integer codes: UIDs by identity, timestamps by sort order (missing last)
+        df["uid_code"] = pd.factorize(df["uid"], use_na_sentinel=False)[0]
+        ts_code = pd.factorize(df["ts"], sort=True)[0]
+        df["ts_code"] = np.where(ts_code < 0, len(df), ts_code)
+
+        keys = ["record", "uid_code"]
+
+        # Every duplicate counts once, and once more when it is earlier than the log kept so far
+        df["running_min"] = df.groupby(keys, sort=False)["ts_code"].cummin()
+        df["replaced"] = df["ts_code"] < df.groupby(keys, sort=False)["running_min"].shift()
+
+        grouped = df.groupby(keys, sort=False)
+        df["redundant_count"] = grouped["position"].transform("size") - 1 + grouped["replaced"].transform("sum")
+        df["duplicate_index"] = grouped.cumcount()
+        df["first_seen"] = grouped["position"].transform("min")
+
+        # Keep the earliest log per record & UID (first seen on ties),
+        # ordered by where the UID first appeared in the record
+        kept = (
+            df.sort_values(keys + ["ts_code"], kind="stable")
+            .drop_duplicates(keys, keep="first")
+            .sort_values("first_seen", kind="stable")
+        )
+
+        kept_logs = {}
+        for record_index, position in zip(kept["record"], kept["position"]):
+            kept_logs.setdefault(record_index, []).append(all_logs[position])
+
+        # Report redundant UIDs in the order their first duplicate appeared
+        first_duplicates = df[df["duplicate_index"] == 1]
+        redundant = {}
+        for record_index, position, count in zip(
+            first_duplicates["record"], first_duplicates["position"], first_duplicates["redundant_count"]
+        ):
+            redundant.setdefault(record_index, {})[all_logs[position].get("uid")] = int(count)
+        redundant_totals = first_duplicates.groupby("record")["redundant_count"].sum()
+
+        for index, record in enumerate(data):
+            record["logs"] = kept_logs.get(index, [])
+            record["redundant_uids"] = redundant.get(index, {})
+            record["redundant_total"] = int(redundant_totals.get(index, 0))
 
         return data
 
@@ -79,7 +104,13 @@ class Preprocessor:
         """Convert cleaned data into structured session dictionaries."""
         sessions = []
 
-        for index, record in enumerate(data, start=1):
+        # Parse every log timestamp and reception time in one batch each
+        adjusted_ts = iter(TimestampHelper.adjust_dst_batch(
+            log["ts"] for record in data for log in record.get("logs", [])
+        ))  # "YYYY-MM-DD HH:MM:SS"
+        received_ats = TimestampHelper.safe_parse_batch(record.get("received_at") for record in data)
+
+        for index, (record, received_at) in enumerate(zip(data, received_ats), start=1):
 
             logs = record.get("logs", [])
             redundant_uids = record.get("redundant_uids", {})
@@ -87,7 +118,7 @@ class Preprocessor:
             dates = []  # will collect YYYY-MM-DD from each log
 
             for log in logs:
-                ts_str = TimestampHelper.adjust_dst(log["ts"])  # "YYYY-MM-DD HH:MM:SS"
+                ts_str = next(adjusted_ts)
                 if not ts_str:
                     continue
                 date_part, time_part = ts_str.split(" ")
@@ -95,7 +126,6 @@ class Preprocessor:
                 log["ts"] = time_part
 
             logs_date = min(dates) if dates else None
-            received_at = TimestampHelper.safe_parse(record.get("received_at"))
             logs.sort(key=lambda x: x["ts"])
             
             session = {
@@ -105,7 +135,7 @@ class Preprocessor:
                 "matched_sessions": [], # will be enriched by _enrich_session
                 "received_at": received_at,
                 "logs_date": logs_date,
-                "recorded_count": record.get("count", len(logs) + sum(redundant_uids.values())),
+                "recorded_count": record["count"] if "count" in record else len(logs) + record.get("redundant_total", 0),
                 "unique_count": len(logs),
                 "redundant_uids": redundant_uids,
                 "logs": logs
@@ -134,24 +164,42 @@ class Preprocessor:
         matched_sessions = []
         seen_session_ids = set()
 
+        log_us = []
         for log in session_logs:
             log_dt = TimestampHelper.combine_date_time(date_str, log.get("ts"))
-            if not log_dt:
+            if log_dt:
+                log_us.append(TimestampHelper.to_wall_clock_us(log_dt))
+
+        # logs × events overlap matrix; nonzero() walks it row by row, i.e. in
+        # the order a log-by-log scan of the events would find the matches
+        overlaps = TimestampHelper.is_overlap_batch(log_us, self._event_ranges())
+        for event_index in np.nonzero(overlaps)[1]:
+            event = self.ics_data[event_index]
+            if event.get("id") in seen_session_ids:
                 continue
 
-            for event in self.ics_data:
-                if event.get("id") in seen_session_ids:
-                    continue
-                
-                if TimestampHelper.is_overlap(log_dt, event.get("start"), event.get("end"), end_offset_minutes = 15):
-                    event_copy = self._prepare_event_copy(event)
-                    matched_sessions.append(event_copy)
-                    seen_session_ids.add(event.get("id"))
+            event_copy = self._prepare_event_copy(event)
+            matched_sessions.append(event_copy)
+            seen_session_ids.add(event.get("id"))
 
         session["matched_sessions"] = matched_sessions
         titles = [e.pop("_title_for_context", "Unknown session") for e in matched_sessions]
         session["session_context"] = ", ".join(dict.fromkeys(titles))
 
+    def _event_ranges(self):
+        """
+        Bounds of every ICS event (end minus 15 minutes) as an (n_events, 2)
+        array of wall-clock microseconds, parsed once per preprocessor.
+        """
+        if self._ics_ranges is None:
+            # Events without valid bounds get an empty range so they never match
+            ranges = [
+                TimestampHelper.preparse_range(event.get("start"), event.get("end"), end_offset_minutes=15) or (1, 0)
+                for event in self.ics_data
+            ]
+            self._ics_ranges = np.array(ranges, dtype=np.int64).reshape(-1, 2)
+        return self._ics_ranges
+
     def _prepare_event_copy(self, event):
         """Create event copy with split title/details."""
         event_copy = event.copy()
@@ -186,6 +234,7 @@ class Preprocessor:
             sessions = self.processed_sessions
 
         output_path = output_path or get_config().PATHS.PREPROCESSED
-        json_repo = JsonRepository(output_path)
+        # Read back by the validators and the API, never edited by hand
+        json_repo = JsonRepository(output_path, pretty=False)
         json_repo.save_all(sessions)
         return output_path
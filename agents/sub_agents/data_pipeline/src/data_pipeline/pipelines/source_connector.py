@@ -1,18 +1,21 @@
 import os
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict
 from utils import Secrets, logger, get_config
 from utils import RepositoryFactory
 
+# Download chunk size (1 MiB)
+CHUNK_SIZE = 1 << 20
+
 class DataFetcher:
     """
     Robust utility class for downloading logs (JSONL) and ICS calendar data.
 
     Responsibilities:
-    - Fetch logs from a configured URL
-    - Fetch ICS from a configured URL
-    - Save both to disk
+    - Stream logs from a configured URL to disk
+    - Stream ICS from a configured URL to disk
     - Merge generated synthetic logs into the main log file
     """
 
@@ -53,12 +56,35 @@ class DataFetcher:
         if missing:
             raise ValueError(f"Missing required configuration values: {', '.join(missing)}")
 
-    def _fetch(self, url: str, resource_name: str) -> bytes:
-        """Generic fetch wrapper with logging and error handling."""
+    def _fetch(self, url: str, path: str, resource_name: str) -> str:
+        """
+        Stream a remote resource straight to disk.
+
+        The response body is written chunk by chunk to a temporary file next to
+        the target path and moved into place once the download completes, so
+        memory stays bounded by the chunk size and a failed download never
+        truncates the previously fetched file.
+
+        Args:
+            url: The URL to download from
+            path: The file path where data should be saved
+            resource_name: Name of the resource for logging purposes
+
+        Returns:
+            str: The path the resource was saved to.
+        """
+        tmp_path = f"{path}.part"
         try:
-            response = requests.get(url, timeout= 60)
-            response.raise_for_status()
-            return response.content
+            RepositoryFactory.get_repository(path).ensure_directory_exists()
+            # One session per download: requests.Session is not guaranteed
+            # to be thread-safe, and there is no connection to reuse anyway
+            with requests.Session() as session, session.get(url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(tmp_path, path)
+            return path
 
         except requests.Timeout:
             logger.error(f"Timed out while fetching {resource_name}.")
@@ -68,22 +94,14 @@ class DataFetcher:
             logger.error(f"Failed to fetch {resource_name}: {e}.")
             raise
 
-    def _save_data(self, data: bytes, path: str, resource_name: str) -> None:
-        """
-        Helper method to save data using RepositoryFactory.
-        
-        Args:
-            data: The bytes data to save
-            path: The file path where data should be saved
-            resource_name: Name of the resource for logging purposes
-        """
-        try:
-            repo = RepositoryFactory.get_repository(path)
-            repo.save_from_bytes(data)
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to save {resource_name} to {path}: {e}")
             raise
 
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _merge_generated_logs(self) -> None:
         """
         Merge generated synthetic logs into the main logs file.
@@ -126,18 +144,31 @@ class DataFetcher:
     # ----------------------------------------------------------------------
     # Public methods
     # ----------------------------------------------------------------------
-    def run(self) -> Dict[str, bytes]:
+    def run(self) -> Dict[str, str]:
         """
-        Fetch logs and ICS data.
+        Download logs and ICS data directly to disk, concurrently.
 
         Returns:
             dict: {
-                "logs": bytes,
-                "ics": bytes
+                "logs": "<path>",
+                "ics": "<path>"
             }
         """
-        self.ics = self._fetch(self.ics_url, "ics")
-        self.logs = self._fetch(self.logs_url, "logs")
+        resources = {
+            "ics": (self.ics_url, self.ics_path),
+            "logs": (self.logs_url, self.logs_path),
+        }
+
+        # Downloads are I/O bound, so threads overlap them despite the GIL
+        with ThreadPoolExecutor(max_workers=len(resources)) as executor:
+            futures = {
+                name: executor.submit(self._fetch, url, path, name)
+                for name, (url, path) in resources.items()
+            }
+            paths = {name: future.result() for name, future in futures.items()}
+
+        self.ics = paths["ics"]
+        self.logs = paths["logs"]
 
         return {
             "logs": self.logs,
@@ -146,7 +177,7 @@ class DataFetcher:
 
     def save(self) -> Dict[str, str]:
         """
-        Saves fetched data to disk, then merges any generated synthetic logs.
+        Finalizes the fetched data on disk by merging any generated synthetic logs.
 
         Returns:
             dict: {
@@ -155,13 +186,7 @@ class DataFetcher:
             }
         """
         if not self.logs or not self.ics:
-            raise ValueError("Data must contain both 'logs' and 'ics' keys")
-
-        # Save ICS in ics format using RepositoryFactory
-        self._save_data(self.ics, self.ics_path, "ics")
-
-        # Save logs in jsonl format using RepositoryFactory
-        self._save_data(self.logs, self.logs_path, "logs")
+            raise ValueError("Both 'logs' and 'ics' must be fetched first. Run `.run()` first.")
 
         # Merge generated synthetic logs into the main log file
         self._merge_generated_logs()
@@ -0,0 +1,76 @@
+import copy
+import random
+
+from data_pipeline.pipelines.processor import Preprocessor
+
+
+def _separate_redundant(data):
+    # Log-by-log version of Preprocessor._separate_redundant
+    data = copy.deepcopy(data)
+    for record in data:
+        uid_map = {}
+        redundant_count = {}
+        for log in record.get("logs", []):
+            uid = log.get("uid")
+            if uid not in uid_map:
+                uid_map[uid] = log
+            else:
+                redundant_count[uid] = redundant_count.get(uid, 0) + 1
+                if log["ts"] < uid_map[uid]["ts"]:
+                    redundant_count[uid] += 1
+                    uid_map[uid] = log
+        record["logs"] = list(uid_map.values())
+        record["redundant_uids"] = redundant_count
+        record["redundant_total"] = sum(redundant_count.values())
+    return data
+
+
+def _run(data):
+    return Preprocessor.__new__(Preprocessor)._separate_redundant(copy.deepcopy(data))
+
+
+def _assert_same(actual, expected):
+    assert actual == expected
+    # Key order matters too: it is the order logs and UIDs are reported in
+    for got, want in zip(actual, expected):
+        assert list(got["redundant_uids"]) == list(want["redundant_uids"])
+
+
+def test_keeps_the_earliest_log_per_uid():
+    data = [{"device_id": "d", "logs": [
+        {"uid": "a", "ts": "2025-01-01 10:00:05"},
+        {"uid": "b", "ts": "2025-01-01 10:00:01"},
+        {"uid": "a", "ts": "2025-01-01 10:00:02"},
+        {"uid": "a", "ts": "2025-01-01 10:00:09"},
+        {"uid": "b", "ts": "2025-01-01 10:00:01"},
+    ]}]
+    [record] = _run(data)
+    assert record["logs"] == [
+        {"uid": "a", "ts": "2025-01-01 10:00:02"},
+        {"uid": "b", "ts": "2025-01-01 10:00:01"},
+    ]
+    # a: two duplicates, one of them earlier than the log kept; b: one tie
+    assert record["redundant_uids"] == {"a": 3, "b": 1}
+    assert record["redundant_total"] == 4
+    _assert_same([record], _separate_redundant(data))
+
+
+def test_records_without_logs():
+    data = [{"device_id": "d"}, {"device_id": "e", "logs": []}, {"logs": [{"uid": "a", "ts": "1"}]}]
+    result = _run(data)
+    assert [record["logs"] for record in result] == [[], [], [{"uid": "a", "ts": "1"}]]
+    assert [record["redundant_uids"] for record in result] == [{}, {}, {}]
+    assert [record["redundant_total"] for record in result] == [0, 0, 0]
+
+
+def test_matches_the_log_by_log_version():
+    rng = random.Random(3)
+    for _ in range(200):
+        data = [
+            {"device_id": str(device), "logs": [
+                {"uid": rng.choice("abcdef"), "ts": f"2025-01-01 10:00:{rng.randrange(10):02d}", "n": n}
+                for n in range(rng.randrange(12))
+            ]}
+            for device in range(rng.randrange(1, 5))
+        ]
+        _assert_same(_run(data), _separate_redundant(data))
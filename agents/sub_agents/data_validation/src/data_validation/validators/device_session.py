@@ -1,8 +1,18 @@
+import numpy as np
 import pandas as pd
 from utils import logger, get_config
 from utils import CsvRepository, JsonRepository
 from utils import TimestampHelper
 
+# Flag column -> alert reason, ordered by reason text
+ALERT_REASONS = {
+    "is_clock_reset": "Clock reset detected",
+    "is_active_continuous": "Device active unusually long without breaks",
+    "missing_device_id": "Missing device id",
+    "missing_received_at": "Missing received_at datetime",
+    "missing_session_id": "Missing session id",
+}
+
 class DeviceValidator:
     """
     Device Validator for session-based preprocessed data.
@@ -28,53 +38,43 @@ class DeviceValidator:
     # -------------------------------------------------------------------------
     def _flatten_logs(self, sessions):
         """Flatten session-based logs into a DataFrame with timestamps."""
-        records = []
-        for session in sessions:
-            session_id = session.get("session_id")
-            device_id = session.get("device_id")
-            session_received_at = session.get("received_at")
-            session_logs_date = session.get("logs_date")
-
-            for log in session.get("logs", []):
-                uid = str(log.get("uid"))
-                ts = log.get("ts")
-                records.append({
-                    "uid": uid,
-                    "session_id": session_id,
-                    "device_id": device_id,
-                    "timestamp": ts,
-                    "received_at": session_received_at,
-                    "logs_date": session_logs_date
-                })
-
-        df = pd.DataFrame(records)
-        df["timestamp_dt"] = pd.to_datetime(df["timestamp"], errors="coerce")
+        # json_normalize raises KeyError for a session without a logs list
+        sessions = [{**session, "logs": session.get("logs") or []} for session in sessions]
+        df = pd.json_normalize(
+            sessions,
+            record_path="logs",
+            meta=["session_id", "device_id", "received_at", "logs_date"],
+            errors="ignore"
+        )
+        if df.empty:
+            return pd.DataFrame(
+                columns=["uid", "timestamp", "session_id", "device_id", "received_at", "logs_date", "timestamp_dt"]
+            )
+
+        df = df.rename(columns={"ts": "timestamp"})
+        df["uid"] = df["uid"].astype(str)
+        df["timestamp_dt"] = pd.to_datetime(
+            df["timestamp"], format=TimestampHelper.TIME_FORMAT, errors="coerce", cache=True
+        )
+
+        # Group keys are hashed repeatedly, so store them as categorical codes
+        df["device_id"] = df["device_id"].astype("category")
+        df["session_id"] = df["session_id"].astype("category")
         return df
 
     # -------------------------------------------------------------------------
     def _detect_clock_resets(self):
         """Detect backward timestamps, timestamps before system establishment, or date mismatches."""
-        self.df["is_clock_reset"] = False
-
-        # Check for date mismatch (Clock reset)
-        def check_date_mismatch(row):
-            if pd.isna(row["received_at"]):
-                return False
-            
-            # Use UTC to avoid timezone shifts causing false positives
-            try:
-                rec_dt = pd.to_datetime(str(row["received_at"]), utc=True)
-                log_dt = pd.to_datetime(str(row["logs_date"]), utc=True)
-            except Exception:
-                return False
-            
-            if pd.isna(rec_dt) or pd.isna(log_dt):
-                return False
-                
-            return rec_dt.date() != log_dt.date()
-
-
-        self.df["is_clock_reset"] = self.df.apply(check_date_mismatch, axis=1)
+        # Check for date mismatch (Clock reset).
+        # Use UTC to avoid timezone shifts causing false positives
+        rec_dt = pd.to_datetime(
+            self.df["received_at"], format=TimestampHelper.DATETIME_FORMAT, utc=True, errors="coerce", cache=True
+        )
+        log_dt = pd.to_datetime(
+            self.df["logs_date"], format=TimestampHelper.DATE_FORMAT, utc=True, errors="coerce", cache=True
+        )
+
+        self.df["is_clock_reset"] = rec_dt.notna() & log_dt.notna() & (rec_dt.dt.date != log_dt.dt.date)
 
     # -------------------------------------------------------------------------
 
@@ -84,16 +84,10 @@ class DeviceValidator:
         Simplified version: just checks total duration between first and last timestamp.
         NOTE : THIS DOUBLE CHECK FUNCTION SHOULD BE HANDLED FROM HW
         """
-        self.df["is_active_continuous"] = False
-
-        for (device_id, session_id), group in self.df.groupby(["device_id", "session_id"]):
-            timestamps = group["timestamp_dt"].dropna()
-            if len(timestamps) < 2:
-                continue
+        timestamps = self.df.groupby(["device_id", "session_id"], observed=True, sort=False)["timestamp_dt"]
+        duration = timestamps.transform("max") - timestamps.transform("min")
 
-            duration_hours = (timestamps.max() - timestamps.min()).total_seconds() / 3600.0
-            if duration_hours > max_duration_hours:
-                self.df.loc[group.index, "is_active_continuous"] = True
+        self.df["is_active_continuous"] = duration > pd.Timedelta(hours=max_duration_hours)
 
     # -------------------------------------------------------------------------
     def _detect_missing_data(self):
@@ -108,38 +102,32 @@ class DeviceValidator:
     # -------------------------------------------------------------------------
     def _collect_alerts(self):
         """Aggregate alerts per device-session."""
-        alerts = []
-        grouped = self.df.groupby(["session_id", "device_id"])
-
-        alert_id = 1
-
-        for (session_id, device_id), group in grouped:
-            reasons = set()
-            if group["is_active_continuous"].any():
-                reasons.add("Device active unusually long without breaks")
-            if group["is_clock_reset"].any():
-                reasons.add("Clock reset detected")
-            if group["missing_device_id"].any():
-                reasons.add("Missing device id")
-            if group["missing_session_id"].any():
-                reasons.add("Missing session id")
-            if group["missing_received_at"].any():
-                reasons.add("Missing received_at datetime")
-
-            if reasons:
-                alerts.append([
-                    alert_id,
-                    session_id,
-                    device_id,
-                    ";".join(sorted(reasons))
-                ])
-                alert_id += 1
-
-        self.alerts = alerts
+        if not self.df[list(ALERT_REASONS)].to_numpy().any():
+            self.alerts = []
+            return
+
+        flags = self.df.groupby(["session_id", "device_id"], observed=True, sort=False)[list(ALERT_REASONS)].any()
+
+        # Concatenate reasons column by column; ALERT_REASONS is ordered by reason text
+        reasons = pd.Series("", index=flags.index)
+        for column, reason in ALERT_REASONS.items():
+            reasons = reasons + np.where(flags[column], reason + ";", "")
+        reasons = reasons.str.rstrip(";")
+        reasons = reasons[reasons != ""]
+
+        self.alerts = [
+            [alert_id, session_id, device_id, reason]
+            for alert_id, ((session_id, device_id), reason) in enumerate(reasons.items(), start=1)
+        ]
 
     # -------------------------------------------------------------------------
     def run(self):
         """Run full validation pipeline."""
+        if self.df.empty:
+            logger.info("No logs to validate.")
+            self.alerts = []
+            return self.alerts
+
         self._detect_missing_data()
         self._detect_clock_resets()
         self._detect_unusual_active_sessions()
@@ -27,24 +27,18 @@ class IdentityValidator:
     # -------------------------------------------------------------------------
     def _flatten_logs(self, sessions):
         """Flatten session-based logs into a single DataFrame with consistent IDs."""
-        records = []
+        # Build plain tuples in one pass; the redundant count is looked up per
+        # session, so logs never get matched against another session's counts
+        rows = []
         for session in sessions:
             session_id = str(session.get("session_id"))
             device_id = str(session.get("device_id"))
-            redundant_dict = session.get("redundant_uids", {})
-
-            for log in session.get("logs", []):
-                uid = log.get("uid")
-                redundant_count = redundant_dict.get(uid, 0)
-                records.append({
-                    "uid": uid,
-                    "session_id": session_id,
-                    "device_id": device_id,
-                    "redundant_count": int(redundant_count or 0)
-                })
-
-        df = pd.DataFrame(records)
-        return df
+            redundant = session.get("redundant_uids") or {}
+            rows.extend(
+                (log.get("uid"), session_id, device_id, int(redundant.get(log.get("uid"), 0) or 0))
+                for log in session.get("logs") or []
+            )
+        return pd.DataFrame.from_records(rows, columns=["uid", "session_id", "device_id", "redundant_count"])
 
     # -------------------------------------------------------------------------
     def _flag_suspicious_patterns(self):
@@ -1,10 +1,15 @@
-from datetime import datetime, time
+import numpy as np
 import pandas as pd
 from utils import logger, get_config, load_config
 from utils import TimestampHelper
 from utils import JsonRepository, CsvRepository
-from collections import defaultdict
 
+# Flag column -> alert reason, ordered by reason text
+ALERT_REASONS = {
+    "outside_valid_date": "Outside valid date range",
+    "outside_valid_time": "Outside valid time range",
+    "invalid_day_checkin": "Weekend or holiday check-in",
+}
 
 class TimestampValidator:
     """
@@ -24,9 +29,23 @@ class TimestampValidator:
         self.df = self._flatten_logs(self.data)
         self.alerts = []
 
+        # Resolve schedule settings once instead of per validation step
+        schedule = get_config().SCHEDULE
+        self._semester_start = pd.to_datetime(schedule.START_DATE)
+        self._semester_end = pd.to_datetime(schedule.END_DATE)
+        # Daily window as offsets from midnight, compared against the time of day as timedelta64
+        self._day_start = pd.to_timedelta(schedule.START_TIME) if schedule.START_TIME else pd.Timedelta(hours=8)
+        self._day_end = pd.to_timedelta(schedule.END_TIME) if schedule.END_TIME else pd.Timedelta(hours=18)
+        self._holidays = pd.to_datetime(schedule.HOLIDAYS or []).normalize()
+
     # -------------------------------------------------------------------------
     def run(self):
         """Execute full timestamp validation pipeline."""
+        if self.df.empty:
+            logger.info("No logs to validate.")
+            self.alerts = []
+            return self.alerts
+
         self._flag_out_of_date_range_checkins()
         self._flag_out_of_time_range_checkins()
         self._detect_weekend_and_holiday_checkins()
@@ -48,79 +67,68 @@ class TimestampValidator:
     # -------------------------------------------------------------------------
     def _flatten_logs(self, sessions):
         """Flatten session-based logs into a single DataFrame for validation."""
-        records = []
-        for session in sessions:
-            session_id = session.get("session_id")
-            device_id = session.get("device_id")
-            
-            received_at = session.get("received_at")
-            received_date = TimestampHelper.to_date(received_at) if received_at else None
-            recorded_date = received_date or session.get("logs_date")
-
-            for log in session.get("logs", []):
-                records.append({
-                    "uid": log["uid"],
-                    "timestamp": TimestampHelper.to_datetime(recorded_date + " " + log["ts"]),
-                    "session_id": session_id,
-                    "device_id": device_id
-                })
-
-        df = pd.DataFrame(records)
-        return df
+        # json_normalize raises KeyError for a session without a logs list
+        sessions = [{**session, "logs": session.get("logs") or []} for session in sessions]
+        df = pd.json_normalize(
+            sessions,
+            record_path="logs",
+            meta=["session_id", "device_id", "received_at", "logs_date"],
+            errors="ignore"
+        )
+        if df.empty:
+            return pd.DataFrame(columns=["uid", "timestamp", "session_id", "device_id"])
+
+        # Resolve the recorded date once per distinct received_at value
+        received_dates = {
+            value: TimestampHelper.to_date(value)
+            for value in df["received_at"].dropna().unique()
+        }
+        recorded_date = df["received_at"].map(received_dates).fillna(df["logs_date"])
+
+        df["timestamp"] = pd.to_datetime(
+            recorded_date + " " + df["ts"], format=TimestampHelper.DATETIME_FORMAT, errors="coerce", cache=True
+        )
+        return df[["uid", "timestamp", "session_id", "device_id"]]
 
     # -------------------------------------------------------------------------
     def _flag_out_of_time_range_checkins(self):
         """Flag check-ins outside the valid daily time range."""
-        cfg = get_config()
-        start_time = datetime.strptime(cfg.SCHEDULE.START_TIME, "%H:%M:%S").time() if cfg.SCHEDULE.START_TIME else time(8, 0)
-        end_time = datetime.strptime(cfg.SCHEDULE.END_TIME, "%H:%M:%S").time() if cfg.SCHEDULE.END_TIME else time(18, 0)
-
-        self.df["outside_valid_time"] = ~self.df["timestamp"].dt.time.between(start_time, end_time)
+        time_of_day = self.df["timestamp"] - self.df["timestamp"].dt.normalize()
+        self.df["outside_valid_time"] = ~time_of_day.between(self._day_start, self._day_end)
 
     # -------------------------------------------------------------------------
     def _flag_out_of_date_range_checkins(self):
         """Flag check-ins outside the valid semester date range."""
-        cfg = get_config()
-        start_date = pd.to_datetime(cfg.SCHEDULE.START_DATE)
-        end_date = pd.to_datetime(cfg.SCHEDULE.END_DATE)
-
-        self.df["outside_valid_date"] = ~self.df["timestamp"].between(start_date, end_date)
+        self.df["outside_valid_date"] = ~self.df["timestamp"].between(self._semester_start, self._semester_end)
         
     # -------------------------------------------------------------------------
     def _detect_weekend_and_holiday_checkins(self):
         """Detect check-ins on weekends or holidays."""
-        cfg = get_config()
-        holidays = cfg.SCHEDULE.HOLIDAYS or []
-
         self.df["is_weekend"] = self.df["timestamp"].dt.dayofweek >= 5
-        self.df["is_holiday"] = self.df["timestamp"].dt.date.isin(holidays)
+        self.df["is_holiday"] = self.df["timestamp"].dt.normalize().isin(self._holidays)
         self.df["invalid_day_checkin"] = self.df["is_weekend"] | self.df["is_holiday"]
 
     # -------------------------------------------------------------------------
     def _collect_alerts(self):
         """Collect and group alerts by UID, timestamp, session_id, and device_id."""
-        grouped_alerts = defaultdict(set)
-
-        for _, row in self.df.iterrows():
-            key = (row["uid"], row["timestamp"].isoformat(), row["session_id"], row["device_id"])
-
-            if row.get("outside_valid_date"):
-                grouped_alerts[key].add("Outside valid date range")
-            if row.get("outside_valid_time"):
-                grouped_alerts[key].add("Outside valid time range")
-            if row.get("invalid_day_checkin"):
-                grouped_alerts[key].add("Weekend or holiday check-in")
-
-        self.alerts = []
-        alert_id = 1  
-
-        for (uid, ts, session_id, device_id), reasons in grouped_alerts.items():
-            self.alerts.append({
-                "id": alert_id,          
-                "uid": uid,
-                "timestamp": ts,
-                "session_id": session_id,
-                "device_id": device_id,
-                "reasons": ";".join(sorted(reasons))
-            })
-            alert_id += 1
\ No newline at end of file
+        flagged = self.df[self.df[list(ALERT_REASONS)].any(axis=1)]
+        if flagged.empty:
+            self.alerts = []
+            return
+
+        keys = [
+            flagged["uid"],
+            flagged["timestamp"].dt.strftime("%Y-%m-%dT%H:%M:%S").fillna("NaT"),
+            flagged["session_id"],
+            flagged["device_id"]
+        ]
+        flags = flagged[list(ALERT_REASONS)].groupby(keys, sort=False, dropna=False).any()
+
+        # Concatenate reasons column by column; ALERT_REASONS is ordered by reason text
+        reasons = pd.Series("", index=flags.index)
+        for column, reason in ALERT_REASONS.items():
+            reasons = reasons + np.where(flags[column], reason + ";", "")
+
+        alerts = reasons.str.rstrip(";").rename("reasons").reset_index()
+        alerts.insert(0, "id", range(1, len(alerts) + 1))
+        self.alerts = alerts.to_dict("records")
@@ -0,0 +1,38 @@
+from data_validation.validators.identity import IdentityValidator
+
+
+def _flatten(sessions):
+    return IdentityValidator.__new__(IdentityValidator)._flatten_logs(sessions)
+
+
+def test_counts_come_from_the_log_session():
+    sessions = [
+        {"session_id": 1, "device_id": "d", "logs": [{"uid": "a"}], "redundant_uids": {"a": 2}},
+        {"session_id": 1, "device_id": "d", "logs": [{"uid": "a"}], "redundant_uids": {}},
+    ]
+    df = _flatten(sessions)
+    assert df.to_dict("records") == [
+        {"uid": "a", "session_id": "1", "device_id": "d", "redundant_count": 2},
+        {"uid": "a", "session_id": "1", "device_id": "d", "redundant_count": 0},
+    ]
+
+
+def test_int_uids_do_not_match_string_keys():
+    df = _flatten([{"session_id": 1, "device_id": "d", "logs": [{"uid": 7}, {"uid": 8}], "redundant_uids": {"7": 1}}])
+    assert df["uid"].tolist() == [7, 8]
+    assert df["redundant_count"].tolist() == [0, 0]
+
+
+def test_missing_ids_and_logs():
+    df = _flatten([
+        {"logs": [{"uid": "a"}], "redundant_uids": {"a": 3}},
+        {"session_id": 2, "device_id": "d"},
+        {"session_id": 3, "device_id": "d", "logs": None},
+    ])
+    assert df.to_dict("records") == [{"uid": "a", "session_id": "None", "device_id": "None", "redundant_count": 3}]
+
+
+def test_no_logs_gives_the_expected_columns():
+    df = _flatten([{"session_id": 1}])
+    assert df.empty
+    assert list(df.columns) == ["uid", "session_id", "device_id", "redundant_count"]
@@ -9,7 +9,7 @@ from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
 import re
 
-from utils import JsonRepository, CsvRepository, SessionDTO, logger, map_to_session_dto
+from utils import JsonRepository, CsvRepository, SessionDTO, logger, decode_session_dtos
 from api.models import SessionFilters, PaginationParams, SortParams
 from api.constants import SORTABLE_FIELDS
 from api.exceptions import (
@@ -98,6 +98,11 @@ class SessionService:
                     sessions_str = item.get('anomaly_sessions', '')
                     if sessions_str:
                         sids = [s.strip() for s in sessions_str.split(';') if s.strip()]
+                        # Normalize reasons once per alert rather than once per anomaly session
+                        reasons = item.get('reasons', '')
+                        normalize_reasons = isinstance(reasons, str)
+                        if normalize_reasons:
+                            reasons = [r.strip() for r in reasons.split(';') if r.strip()]
                         for sid in sids:
                             try:
                                 sid_int = int(sid)
@@ -105,10 +110,8 @@ class SessionService:
                                     session_alerts[sid_int] = []
                                 alert_info = item.copy()
                                 alert_info['type'] = 'Identity'
-                                # Normalize reasons
-                                reasons = alert_info.get('reasons', '')
-                                if isinstance(reasons, str):
-                                    alert_info['reasons'] = [r.strip() for r in reasons.split(';') if r.strip()]
+                                if normalize_reasons:
+                                    alert_info['reasons'] = reasons
                                     
                                 session_alerts[sid_int].append(alert_info)
                             except ValueError:
@@ -129,14 +132,21 @@ class SessionService:
             SessionNotFoundError: If the data file is not found
         """
         try:
-            raw_data = self.repository.read_all()
+            # Decode straight into DTOs; a missing file reads as no sessions,
+            # as JsonRepository.read_all does, but invalid data is an error
+            try:
+                sessions = decode_session_dtos(self.repository.read_bytes())
+            except FileNotFoundError:
+                sessions = []
+            except ValueError as e:
+                logger.error(f"Invalid session data in {self.repository.file_path}: {e}")
+                raise
             session_alerts = self._get_session_alerts()
             
-            sessions = []
-            for item in raw_data:
-                sid = item.get('session_id')
-                alerts = session_alerts.get(sid, [])
-                sessions.append(map_to_session_dto(item, alert_count=len(alerts), alerts=alerts))
+            for session in sessions:
+                alerts = session_alerts.get(session.session_id, [])
+                session.alert_count = len(alerts)
+                session.alerts = alerts
                 
             return sessions
         except FileNotFoundError as e:
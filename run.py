@@ -1,56 +1,111 @@
-import subprocess
+import asyncio
 import os
+import shutil
 import sys
-import time
+import importlib.util
+from pathlib import Path
+import uvicorn
 from utils import logger, load_config
 
-def run_parallel():
+# uvloop is not available on Windows; the launcher falls back to asyncio there
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+# DEV=1 (or true/yes) runs the API as a `uvicorn --reload` child that restarts on code edits
+DEV_MODE = os.environ.get("DEV", "").strip().lower() in {"1", "true", "yes"}
+
+# Marker left in the dashboard folder once `npm install` has succeeded
+NPM_INSTALL_SENTINEL = ".node_modules.ok"
+
+# Let subprocess launch children with posix_spawn instead of fork+exec. This
+# needs an absolute executable, no cwd and close_fds off; Python creates file
+# descriptors non-inheritable (PEP 446), so nothing extra leaks into children.
+SPAWN_OPTIONS = {"close_fds": False}
+
+def _use_pidfd_child_watcher():
+    """
+    Before Python 3.12, asyncio waits for children with a thread blocked in
+    waitpid per child. On Linux, a pidfd watcher instead lets the event loop
+    be woken by the kernel when a child exits. uvloop and Python 3.12+
+    already do this, and other platforms keep the default watcher.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return  # Kernel without pidfd support
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+async def run_parallel():
     load_config()
     logger.info("      AGENTIC TRACKING SYSTEM - DASHBOARD & API")
-    
-    # 1. Start the API
+
+    # 1. Start the API, in this process on the launcher's own event loop unless
+    # auto-reload is requested, which needs uvicorn's own supervisor process
     logger.info("Starting API on http://localhost:8000...")
-    api_process = subprocess.Popen(
-        [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
-    )
+    if not UVLOOP_AVAILABLE:
+        logger.info("uvloop not installed, API will run on the default asyncio loop.")
+    api_server = api_process = None
+    if DEV_MODE:
+        logger.info("DEV mode: API will reload on code changes.")
+        api_command = [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+        if UVLOOP_AVAILABLE:
+            api_command += ["--loop", "uvloop"]
+        api_process = await asyncio.create_subprocess_exec(*api_command, **SPAWN_OPTIONS)
+        api_task = asyncio.create_task(api_process.wait())
+    else:
+        api_server = uvicorn.Server(uvicorn.Config("api.main:app", host="0.0.0.0", port=8000))
+        api_task = asyncio.create_task(api_server.serve())
 
     # 2. Start the Dashboard
     logger.info("Starting Dashboard...")
     dashboard_path = os.path.join(os.getcwd(), "dashboard")
-    
-    # Check if node_modules exists
-    if not os.path.exists(os.path.join(dashboard_path, "node_modules")):
-        logger.warning("node_modules not found in dashboard. Attempting npm install...")
-        subprocess.run(["npm", "install"], cwd=dashboard_path, shell=True)
-
-    dashboard_process = subprocess.Popen(
-        ["npm", "run", "dev"],
-        cwd=dashboard_path,
-        shell=True
-    )
+    # Resolve npm (npm.cmd on Windows) once so it can be launched without a shell;
+    # --prefix points npm at the dashboard instead of changing the child's cwd
+    npm = shutil.which("npm") or "npm"
+    npm_command = [npm, "--prefix", dashboard_path]
+
+    # Written after a successful install, so later launches skip the install step
+    install_sentinel = Path(dashboard_path, NPM_INSTALL_SENTINEL)
+    if not install_sentinel.exists():
+        logger.warning("Dashboard dependencies not installed. Attempting npm install...")
+        npm_install = await asyncio.create_subprocess_exec(*npm_command, "install", **SPAWN_OPTIONS)
+        if await npm_install.wait() == 0:
+            install_sentinel.touch()
+        else:
+            logger.error("npm install failed, the dashboard may not start.")
+
+    dashboard_process = await asyncio.create_subprocess_exec(*npm_command, "run", "dev", **SPAWN_OPTIONS)
 
     logger.info("Both services are starting. Press Ctrl+C to stop both.")
 
-    try:
-        while True:
-            # Check if processes are still running
-            api_status = api_process.poll()
-            dash_status = dashboard_process.poll()
-
-            if api_status is not None:
-                logger.error(f"API process exited with code {api_status}")
-                break
-            if dash_status is not None:
-                logger.error(f"Dashboard process exited with code {dash_status}")
-                break
-            
-            time.sleep(1)
+    dashboard_task = asyncio.create_task(dashboard_process.wait())
 
-    except KeyboardInterrupt:
+    try:
+        # Block until either service stops instead of polling them
+        done, _ = await asyncio.wait({api_task, dashboard_task}, return_when=asyncio.FIRST_COMPLETED)
+        if api_task in done:
+            logger.error("API server stopped")
+        else:
+            logger.error(f"Dashboard process exited with code {dashboard_process.returncode}")
+    finally:
         logger.info("Shutting down services...")
-        api_process.terminate()
-        dashboard_process.terminate()
+        if dashboard_process.returncode is None:
+            dashboard_process.terminate()
+        if api_process is not None and api_process.returncode is None:
+            api_process.terminate()
+        if api_server is not None:
+            api_server.should_exit = True
+        await asyncio.gather(dashboard_task, api_task, return_exceptions=True)
         logger.info("Cleanup complete.")
 
 if __name__ == "__main__":
-    run_parallel()
+    try:
+        if UVLOOP_AVAILABLE:
+            import uvloop
+            uvloop.run(run_parallel())
+        else:
+            _use_pidfd_child_watcher()
+            asyncio.run(run_parallel())
+    except KeyboardInterrupt:
+        pass
@@ -3,40 +3,62 @@
 # SPDX-License-Identifier: MIT
 
 # src/utils/__init__.py
+import importlib
+
+# Imported eagerly: it loads the project .env into os.environ, and that has to
+# happen before load_config applies environment overrides to config.json.
 from .src.utils.Secrets import Secrets
-from .src.utils.config import load_config, get_config
-from .src.utils.logger import logger
-from .src.utils.helpers.time import TimestampHelper
-from .src.utils.models.gemini import GeminiModel
-from .src.utils.models.ragarenn import RagarennModel
-from .src.utils.storage.factory import RepositoryFactory
-from .src.utils.storage.base import FileRepository
-from .src.utils.storage.json_repo import JsonRepository
-from .src.utils.storage.jsonl_repo import JsonlRepository
-from .src.utils.storage.csv_repo import CsvRepository
-from .src.utils.storage.ics_repo import IcsRepository
-from .src.utils.DTOs.attendance.SessionDTO import SessionDTO
-from .src.utils.DTOs.attendance.MatchedSessionDTO import MatchedSessionDTO
-from .src.utils.DTOs.attendance.LogEntryDTO import LogEntryDTO
-from .src.utils.DTOs.groups.GroupsDTO import GroupsDTO
-from .src.utils.DTOs.groups.GroupItemDTO import GroupItemDTO
-from .src.utils.DTOs.alerts.DeviceAlertDTO import DeviceAlertDTO
-from .src.utils.DTOs.alerts.IdentityAlertDTO import IdentityAlertDTO
-from .src.utils.DTOs.alerts.TimestampAlertDTO import TimestampAlertDTO
-from .src.utils.mappers.session_mappers import (
-    map_to_session_dto,
-    map_to_session_dtos,
-    map_to_matched_session_dto,
-    map_to_log_entry_dto,
-    parse_datetime
-)
-from .src.utils.mappers.alert_mappers import (
-    map_to_device_alert_dto,
-    map_to_identity_alert_dto,
-    map_to_timestamp_alert_dto,
-    split_semicolon_list
-)
-from .src.utils.mappers.group_mappers import map_to_group_item_dto
+
+# Other public names are resolved on first access (PEP 562), so importing one
+# helper does not pull in pydantic, openai and every storage backend.
+_LAZY = {
+    "load_config": ".src.utils.config",
+    "get_config": ".src.utils.config",
+    "logger": ".src.utils.logger",
+    "TimestampHelper": ".src.utils.helpers.time",
+    "GeminiModel": ".src.utils.models.gemini",
+    "RagarennModel": ".src.utils.models.ragarenn",
+    "RepositoryFactory": ".src.utils.storage.factory",
+    "FileRepository": ".src.utils.storage.base",
+    "JsonRepository": ".src.utils.storage.json_repo",
+    "JsonlRepository": ".src.utils.storage.jsonl_repo",
+    "CsvRepository": ".src.utils.storage.csv_repo",
+    "IcsRepository": ".src.utils.storage.ics_repo",
+    "ParquetRepository": ".src.utils.storage.parquet_repo",
+    "SessionDTO": ".src.utils.DTOs.attendance.SessionDTO",
+    "MatchedSessionDTO": ".src.utils.DTOs.attendance.MatchedSessionDTO",
+    "LogEntryDTO": ".src.utils.DTOs.attendance.LogEntryDTO",
+    "GroupsDTO": ".src.utils.DTOs.groups.GroupsDTO",
+    "GroupItemDTO": ".src.utils.DTOs.groups.GroupItemDTO",
+    "DeviceAlertDTO": ".src.utils.DTOs.alerts.DeviceAlertDTO",
+    "IdentityAlertDTO": ".src.utils.DTOs.alerts.IdentityAlertDTO",
+    "TimestampAlertDTO": ".src.utils.DTOs.alerts.TimestampAlertDTO",
+    "map_to_session_dto": ".src.utils.mappers.session_mappers",
+    "map_to_session_dtos": ".src.utils.mappers.session_mappers",
+    "map_to_matched_session_dto": ".src.utils.mappers.session_mappers",
+    "map_to_log_entry_dto": ".src.utils.mappers.session_mappers",
+    "parse_datetime": ".src.utils.mappers.session_mappers",
+    "decode_session_dtos": ".src.utils.mappers.session_mappers",
+    "map_to_device_alert_dto": ".src.utils.mappers.alert_mappers",
+    "map_to_identity_alert_dto": ".src.utils.mappers.alert_mappers",
+    "map_to_timestamp_alert_dto": ".src.utils.mappers.alert_mappers",
+    "split_semicolon_list": ".src.utils.mappers.alert_mappers",
+    "map_to_group_item_dto": ".src.utils.mappers.group_mappers",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "logger",
@@ -60,6 +82,7 @@ __all__ = [
     "JsonlRepository",
     "CsvRepository",
     "IcsRepository",
+    "ParquetRepository",
 
     #DTOs
     "SessionDTO",
@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import List
 
-class DeviceAlertDTO(BaseModel):
+@dataclass(slots=True)
+class DeviceAlertDTO:
     """DTO for device validation alerts."""
-    id: int = Field(..., description="Unique alert identifier")
-    session_id: int = Field(..., description="ID of the session where alert triggered")
-    device_id: str = Field(..., description="Device ID associated with the alert")
-    reasons: List[str] = Field(..., description="List of reasons for the alert")
+    id: int = field(metadata={"description": "Unique alert identifier"})
+    session_id: int = field(metadata={"description": "ID of the session where alert triggered"})
+    device_id: str = field(metadata={"description": "Device ID associated with the alert"})
+    reasons: List[str] = field(metadata={"description": "List of reasons for the alert"})
@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import List
 
-class IdentityAlertDTO(BaseModel):
+@dataclass(slots=True)
+class IdentityAlertDTO:
     """DTO for identity validation alerts."""
-    id: int = Field(..., description="Unique alert identifier")
-    uid: str = Field(..., description="User ID (UID) involved in the alert")
-    device_id: str = Field(..., description="Device ID where the alert occurred")
-    normal_sessions_count: int = Field(..., description="Count of normal sessions for this user")
-    repeated_anomaly_count: int = Field(..., description="Count of repeated anomalies")
-    anomaly_sessions: List[int] = Field(..., description="List of session IDs flagged as anomalies")
-    reasons: List[str] = Field(..., description="List of reasons for the alert")
+    id: int = field(metadata={"description": "Unique alert identifier"})
+    uid: str = field(metadata={"description": "User ID (UID) involved in the alert"})
+    device_id: str = field(metadata={"description": "Device ID where the alert occurred"})
+    normal_sessions_count: int = field(metadata={"description": "Count of normal sessions for this user"})
+    repeated_anomaly_count: int = field(metadata={"description": "Count of repeated anomalies"})
+    anomaly_sessions: List[int] = field(metadata={"description": "List of session IDs flagged as anomalies"})
+    reasons: List[str] = field(metadata={"description": "List of reasons for the alert"})
@@ -1,12 +1,13 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List
 
-class TimestampAlertDTO(BaseModel):
+@dataclass(slots=True)
+class TimestampAlertDTO:
     """DTO for timestamp validation alerts."""
-    id: int = Field(..., description="Unique alert identifier")
-    uid: str = Field(..., description="User ID (UID) involved")
-    timestamp: datetime = Field(..., description="Timestamp of the alert")
-    session_id: int = Field(..., description="Session ID associated with the alert")
-    device_id: str = Field(..., description="Device ID")
-    reasons: List[str] = Field(..., description="List of reasons for the alert")
+    id: int = field(metadata={"description": "Unique alert identifier"})
+    uid: str = field(metadata={"description": "User ID (UID) involved"})
+    timestamp: datetime = field(metadata={"description": "Timestamp of the alert"})
+    session_id: int = field(metadata={"description": "Session ID associated with the alert"})
+    device_id: str = field(metadata={"description": "Device ID"})
+    reasons: List[str] = field(metadata={"description": "List of reasons for the alert"})
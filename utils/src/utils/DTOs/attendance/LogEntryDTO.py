@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 
-class LogEntryDTO(BaseModel):
+@dataclass(slots=True)
+class LogEntryDTO:
     """DTO for a single attendance log entry."""
-    ts: str = Field(..., description="Timestamp of the log entry")
-    uid: str = Field(..., description="User ID (UID) recorded")
+    ts: str = field(metadata={"description": "Timestamp of the log entry"})
+    uid: str = field(metadata={"description": "User ID (UID) recorded"})
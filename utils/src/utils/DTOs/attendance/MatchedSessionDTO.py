@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from datetime import datetime
 
-class MatchedSessionDTO(BaseModel):
+@dataclass(slots=True)
+class MatchedSessionDTO:
     """DTO for a session matched across different criteria."""
-    id: str = Field(..., description="Unique identifier for the matched session")
-    summary: str = Field(..., description="Summary of the match")
-    start: datetime = Field(..., description="Start time of the matched session")
-    end: datetime = Field(..., description="End time of the matched session")
+    id: str = field(metadata={"description": "Unique identifier for the matched session"})
+    summary: str = field(metadata={"description": "Summary of the match"})
+    start: datetime = field(metadata={"description": "Start time of the matched session"})
+    end: datetime = field(metadata={"description": "End time of the matched session"})
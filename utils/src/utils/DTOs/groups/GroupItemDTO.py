@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import List
 
-class GroupItemDTO(BaseModel):
+@dataclass(slots=True)
+class GroupItemDTO:
     """DTO for an individual group."""
-    name: str = Field(..., description="Name of the group")
-    members: List[str] = Field(..., description="List of member UIDs in the group")
-    member_count: int = Field(..., description="Total count of members in the group")
+    name: str = field(metadata={"description": "Name of the group"})
+    members: List[str] = field(metadata={"description": "List of member UIDs in the group"})
+    member_count: int = field(metadata={"description": "Total count of members in the group"})
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import Dict, List
 
-@dataclass
+@dataclass(slots=True)
 class GroupsDTO:
-    groups: Dict[str, List[str]]
\ No newline at end of file
+    groups: Dict[str, List[str]]
@@ -1,22 +1,44 @@
+import asyncio
 import json
 import os
 import time
 import threading
-from dataclasses import dataclass
 from logger import *
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# watchdog delivers file change events from the OS (inotify, FSEvents,
+# ReadDirectoryChangesW); without it the watcher falls back to polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 # -----------------------------
 # Recursive wrapper for any dict
 # -----------------------------
 class DotDict:
     """Recursively convert a dict to an object with dot-access."""
     def __init__(self, data: dict):
-        for key, value in data.items():
-            if isinstance(value, dict):
-                value = DotDict(value)  # recurse for nested dict
-            elif isinstance(value, list):
-                value = [DotDict(v) if isinstance(v, dict) else v for v in value]  # handle lists of dicts
-            setattr(self, key, value)
+        self.__dict__.update({key: self._wrap(value) for key, value in data.items()})
+
+    @staticmethod
+    def _wrap(value):
+        if isinstance(value, dict):
+            return DotDict(value)  # recurse for nested dict
+        if isinstance(value, list):
+            return [DotDict(v) if isinstance(v, dict) else v for v in value]  # handle lists of dicts
+        return value
 
     def to_dict(self):
         """Convert back to regular dict recursively."""
@@ -30,21 +52,23 @@ class DotDict:
         return result
 
 # -----------------------------
-# Top-level config dataclass
+# Top-level config
 # -----------------------------
-@dataclass
-class Config:
-    raw: DotDict
-
-    def __getattr__(self, item):
-        # Delegate attribute access to the DotDict
-        return getattr(self.raw, item)
+class Config(DotDict):
+    """
+    Top-level configuration. Attributes live directly on the instance,
+    so `config.X` is a plain attribute lookup rather than a delegated one.
+    """
+    def reload(self, data: dict) -> None:
+        """Swap in freshly loaded data, keeping existing references to this instance valid."""
+        self.__dict__ = DotDict(data).__dict__
 
 # -----------------------------
 # Module-level cache
 # -----------------------------
 _config_instance: Config | None = None
-_watcher_thread: threading.Thread | None = None
+_watcher = None  # watchdog Observer, or polling thread when watchdog is missing
+_reload_task: asyncio.Task | None = None  # applies watchdog events on the event loop
 _stop_watcher = False
 
 # -----------------------------
@@ -53,24 +77,77 @@ _stop_watcher = False
 def _load_data(path: str) -> dict:
     """Helper to read and process the config file."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Override top-level keys with environment variables if they exist
-        for key in data.keys():
-            env_value = os.getenv(key)
-            if env_value is not None:
-                try:
-                    data[key] = json.loads(env_value)  # parse JSON string if possible
-                except json.JSONDecodeError:
-                    data[key] = env_value
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+
+        # Override top-level keys with environment variables if they exist;
+        # only keys present in both are visited
+        env = os.environ
+        for key in data.keys() & env.keys():
+            env_value = env[key]
+            try:
+                data[key] = _json_loads(env_value)  # parse JSON string if possible
+            except json.JSONDecodeError:
+                data[key] = env_value
         return data
     except Exception as e:
         logger.error(f"Error reading config data from {path}: {e}")
         raise
 
+def _reload_config(path: str):
+    """Reload the config file into the cached instance."""
+    logger.info(f"Config file {path} changed, reloading...")
+    try:
+        new_data = _load_data(path)
+        if _config_instance:
+            # Reload in place so references to the Config remain valid
+            _config_instance.reload(new_data)
+            logger.info("Configuration reloaded successfully")
+    except Exception as e:
+        logger.error(f"Failed to reload config: {e}")
+
+async def _reload_worker(queue: asyncio.Queue):
+    """Apply config reloads posted by the watchdog thread, one at a time."""
+    while True:
+        path = await queue.get()
+        # Reading the file is blocking I/O, keep it off the event loop
+        await asyncio.to_thread(_reload_config, path)
+
+def _post_reload(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, path: str):
+    """Hand a change event from the watchdog thread over to the event loop."""
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, path)
+    except RuntimeError:
+        # The loop has been closed, reload from the watcher thread instead
+        _reload_config(path)
+
+class _ConfigFileHandler(FileSystemEventHandler):
+    """Reloads the config when the OS reports a change to the watched file."""
+    def __init__(self, path: str, on_change=_reload_config):
+        super().__init__()
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.last_mtime = self._mtime()
+
+    def _mtime(self) -> float:
+        try:
+            return os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return 0
+
+    def on_any_event(self, event):
+        # Editors often save by writing a temp file and renaming it over the target
+        targets = (event.src_path, getattr(event, "dest_path", ""))
+        if event.is_directory or self.path not in map(os.path.abspath, filter(None, targets)):
+            return
+        # A single save can emit several events; reload once per new mtime
+        current_mtime = self._mtime()
+        if current_mtime and current_mtime != self.last_mtime:
+            self.last_mtime = current_mtime
+            self.on_change(self.path)
+
 def _watch_config(path: str):
-    """Background thread to watch for file changes."""
+    """Background thread polling for file changes, used when watchdog is missing."""
     last_mtime = 0
     try:
         last_mtime = os.stat(path).st_mtime
@@ -82,41 +159,60 @@ def _watch_config(path: str):
         try:
             current_mtime = os.stat(path).st_mtime
             if current_mtime != last_mtime:
-                logger.info(f"Config file {path} changed, reloading...")
                 last_mtime = current_mtime
-                try:
-                    new_data = _load_data(path)
-                    if _config_instance:
-                        # Update the existing DotDict in place so references remain valid if possible,
-                        # but since DotDict structure might change, we replace the raw attribute.
-                        _config_instance.raw = DotDict(new_data)
-                        logger.info("Configuration reloaded successfully")
-                except Exception as e:
-                    logger.error(f"Failed to reload config: {e}")
+                _reload_config(path)
         except FileNotFoundError:
             pass
         except Exception as e:
             logger.error(f"Error in config watcher: {e}")
 
+def _start_watcher(path: str):
+    """
+    Watch the config file, via OS notifications when watchdog is installed.
+    When called from a running event loop, reloads are queued onto that loop
+    so the watchdog thread only wakes it when the file actually changes.
+    """
+    global _reload_task
+
+    if WATCHDOG_AVAILABLE:
+        on_change = _reload_config
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            queue = asyncio.Queue()
+            _reload_task = loop.create_task(_reload_worker(queue))
+            on_change = lambda changed_path: _post_reload(loop, queue, changed_path)
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_ConfigFileHandler(path, on_change), os.path.dirname(os.path.abspath(path)), recursive=False)
+        observer.start()
+        return observer
+
+    thread = threading.Thread(target=_watch_config, args=(path,), daemon=True)
+    thread.start()
+    return thread
+
 def load_config(path="config.json", start_watcher=True) -> Config:
     """
     Load the configuration from a JSON file (with optional env overrides)
     and wrap it recursively in DotDict for dot-access.
     """
-    global _config_instance, _watcher_thread
+    global _config_instance, _watcher
 
     if _config_instance is None:
         try:
             logger.info(f"Loading configuration from {path}")
             data = _load_data(path)
 
-            # Wrap entire config in DotDict
-            _config_instance = Config(raw=DotDict(data))
+            # Wrap entire config for dot-access
+            _config_instance = Config(data)
             logger.info("Configuration loaded successfully")
             
-            if start_watcher and _watcher_thread is None:
-                _watcher_thread = threading.Thread(target=_watch_config, args=(path,), daemon=True)
-                _watcher_thread.start()
+            if start_watcher and _watcher is None:
+                _watcher = _start_watcher(path)
                 logger.info(f"Started config watcher for {path}")
                 
         except FileNotFoundError:
@@ -1,13 +1,77 @@
+import functools
 from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
 from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 
+# Bound once at import: the timezone every helper converts to, and the
+# normalized datetime format, both used on per-timestamp paths
+_PARIS = ZoneInfo("Europe/Paris")
+_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Origin and unit of the integer wall-clock times used for range checks
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+
+def _fromisoformat(ts: str) -> datetime:
+    """datetime.fromisoformat that also accepts a trailing 'Z' on Python < 3.11."""
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    return datetime.fromisoformat(ts)
+
+# Timestamp columns repeat the same strings many times; parsing is pure (the
+# result only depends on the string and datetimes are immutable), so each
+# distinct string is parsed once
+@functools.lru_cache(maxsize=65536)
+def _parse_timestamp(ts: str) -> datetime | None:
+    """Parse one timestamp string into a naive Europe/Paris datetime."""
+    # Fast path: plain ISO-8601 strings are parsed in C without building a
+    # pandas Timestamp; other formats fall through to pd.to_datetime
+    try:
+        dt = _fromisoformat(ts)
+    except ValueError:
+        pass
+    else:
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(_PARIS).replace(tzinfo=None)
+        return dt.replace(microsecond=0)
+
+    try:
+        # Detect Zulu timestamps explicitly
+        if ts.endswith("Z"):
+            dt = pd.to_datetime(ts, utc=True)
+        else:
+            dt = pd.to_datetime(ts, errors="coerce", utc=False)
+
+        if pd.isna(dt):
+            return None
+
+        # Convert tz-aware timestamps to Europe/Paris naive
+        if getattr(dt, "tzinfo", None) is not None:
+            dt = dt.tz_convert("Europe/Paris").tz_localize(None)
+
+        # Drop microseconds
+        dt = dt.replace(microsecond=0)
+        
+        return dt.to_pydatetime()
+    except Exception:
+        return None
+
 class TimestampHelper:
     """
     Helper class for timestamp manipulations, specifically tailored for
     handling various input formats and converting them to Europe/Paris time.
     """
 
+    # Formats of the normalized strings produced by this helper
+    DATETIME_FORMAT = _FMT
+    DATE_FORMAT = "%Y-%m-%d"
+    TIME_FORMAT = "%H:%M:%S"
+
+    # Time of day followed by 'Z' or a UTC offset, marking a timezone-aware string
+    TZ_SUFFIX_PATTERN = r"\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}(?::?\d{2})?)$"
+
     @staticmethod
     def safe_parse(ts: str) -> str | None:
         """
@@ -17,7 +81,7 @@ class TimestampHelper:
         dt = TimestampHelper.to_datetime(ts)
         if dt is None:
             return None
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return dt.strftime(_FMT)
 
     @staticmethod
     def to_date(ts: str) -> str | None:
@@ -27,7 +91,7 @@ class TimestampHelper:
         dt = TimestampHelper.to_datetime(ts)
         if dt is None:
             return None
-        return dt.strftime("%Y-%m-%d")
+        return dt.strftime(TimestampHelper.DATE_FORMAT)
 
     @staticmethod
     def adjust_dst(ts: str) -> str | None:
@@ -38,59 +102,99 @@ class TimestampHelper:
         and is adjusted by subtracting one hour to align it with standard winter time.
         """
         try:
-            dt = TimestampHelper.to_datetime(ts)
-            if dt is None:
-                return None
-
-            # Re-localize to Paris to check DST status
-            # dt is already naive Paris time from to_datetime
-            dt_with_tz = dt.replace(tzinfo=ZoneInfo("Europe/Paris"))
-            
-            # Check if DST is active
-            dst_offset = dt_with_tz.dst()
-            is_dst = dst_offset is not None and dst_offset != timedelta(0)
-
-            if is_dst:
-                # Summer → keep summer timestamp untouched
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                # Winter → subtract one hour to convert the recorded
-                # summer time to correct winter time
-                winter_dt = dt - timedelta(hours=1)
-                return winter_dt.strftime("%Y-%m-%d %H:%M:%S")
-
+            return TimestampHelper._adjust_dst_datetime(TimestampHelper.to_datetime(ts))
         except Exception:
             return None
 
+    @staticmethod
+    def _adjust_dst_datetime(dt: datetime | None) -> str | None:
+        """DST adjustment of an already parsed naive Paris datetime (see adjust_dst)."""
+        if dt is None:
+            return None
+
+        # Re-localize to Paris to check DST status
+        # dt is already naive Paris time from to_datetime
+        dt_with_tz = dt.replace(tzinfo=_PARIS)
+        
+        # Check if DST is active
+        dst_offset = dt_with_tz.dst()
+        is_dst = dst_offset is not None and dst_offset != timedelta(0)
+
+        if is_dst:
+            # Summer → keep summer timestamp untouched
+            return dt.strftime(_FMT)
+        else:
+            # Winter → subtract one hour to convert the recorded
+            # summer time to correct winter time
+            winter_dt = dt - timedelta(hours=1)
+            return winter_dt.strftime(_FMT)
+
     @staticmethod
     def to_datetime(ts: str) -> datetime | None:
         """
         Parse a timestamp string into a naive datetime object
-        representing Europe/Paris time.
+        representing Europe/Paris time. Results are cached per string.
         """
         if not isinstance(ts, str):
             return None
 
+        return _parse_timestamp(ts)
+
+    @staticmethod
+    def to_datetime_batch(values: Iterable) -> pd.Series:
+        """
+        Vectorized to_datetime: parse many timestamp strings with a couple of
+        pandas calls instead of one pd.to_datetime call per value.
+
+        Returns:
+            Series of naive Europe/Paris datetimes (NaT where parsing fails)
+        """
+        raw = pd.Series(list(values), dtype=object)
+        result = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns]")
+        is_str = raw.map(lambda value: isinstance(value, str)).astype(bool)
+        strings = raw[is_str].astype(str)
+        if strings.empty:
+            return result
+
         try:
-            # Detect Zulu timestamps explicitly
-            if ts.endswith("Z"):
-                dt = pd.to_datetime(ts, utc=True)
-            else:
-                dt = pd.to_datetime(ts, errors="coerce", utc=False)
+            aware = strings.str.contains(TimestampHelper.TZ_SUFFIX_PATTERN, regex=True)
+            naive_part = pd.to_datetime(strings[~aware], format="ISO8601", errors="coerce")
+            aware_part = pd.to_datetime(strings[aware], format="ISO8601", errors="coerce", utc=True)
+            aware_part = aware_part.dt.tz_convert("Europe/Paris").dt.tz_localize(None)
+            result.loc[naive_part.index] = naive_part.astype("datetime64[ns]")
+            result.loc[aware_part.index] = aware_part.astype("datetime64[ns]")
+        except (ValueError, TypeError):
+            pass  # e.g. a timezone the pattern missed, parse everything one by one
 
-            if pd.isna(dt):
-                return None
+        # Non-ISO strings go through the scalar parser, which infers their format
+        for index in result.index[result.isna() & is_str]:
+            dt = TimestampHelper.to_datetime(raw[index])
+            if dt is not None:
+                result[index] = dt
 
-            # Convert tz-aware timestamps to Europe/Paris naive
-            if getattr(dt, "tzinfo", None) is not None:
-                dt = dt.tz_convert("Europe/Paris").tz_localize(None)
+        # Drop microseconds
+        return result.dt.floor("s")
 
-            # Drop microseconds
-            dt = dt.replace(microsecond=0)
-            
-            return dt.to_pydatetime()
-        except Exception:
-            return None
+    @staticmethod
+    def safe_parse_batch(values: Iterable) -> List[str | None]:
+        """
+        Vectorized safe_parse: format many timestamps as 'YYYY-MM-DD HH:MM:SS'
+        in Europe/Paris time, None where parsing fails.
+        """
+        formatted = TimestampHelper.to_datetime_batch(values).dt.strftime(_FMT)
+        return [value if isinstance(value, str) else None for value in formatted]
+
+    @staticmethod
+    def adjust_dst_batch(values: Iterable) -> List[str | None]:
+        """
+        Vectorized adjust_dst: parses all timestamps at once, then applies the
+        same DST rule as adjust_dst to each.
+        """
+        parsed = TimestampHelper.to_datetime_batch(values)
+        return [
+            None if pd.isna(dt) else TimestampHelper._adjust_dst_datetime(dt.to_pydatetime())
+            for dt in parsed
+        ]
 
     @staticmethod
     def now_paris() -> datetime:
@@ -100,7 +204,7 @@ class TimestampHelper:
         Returns:
             Naive datetime representing current Paris time
         """
-        return datetime.now(ZoneInfo("Europe/Paris")).replace(tzinfo=None)
+        return datetime.now(_PARIS).replace(tzinfo=None)
 
     @staticmethod
     def is_within_window(target_time: datetime, window_seconds: int = 60) -> bool:
@@ -145,8 +249,8 @@ class TimestampHelper:
             return False
 
         try:
-            start_dt = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+            start_dt = _fromisoformat(start_str)
+            end_dt = _fromisoformat(end_str)
 
             # Apply the offset to end
             if end_offset_minutes:
@@ -161,3 +265,47 @@ class TimestampHelper:
 
         except (ValueError, TypeError):
             return False
+
+    @staticmethod
+    def to_wall_clock_us(dt: datetime) -> int:
+        """
+        Wall-clock time of a datetime as integer microseconds since 1970-01-01,
+        ignoring its timezone the same way is_overlap does for naive logs.
+        """
+        return (dt.replace(tzinfo=None) - _EPOCH) // _ONE_US
+
+    @staticmethod
+    def preparse_range(start_str: str, end_str: str, end_offset_minutes: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        Parse a start/end pair once into wall-clock microsecond bounds, so
+        many logs can be checked against it with integer comparisons.
+
+        Returns:
+            (start_us, end_us), or None if either bound is missing or invalid
+        """
+        if not start_str or not end_str:
+            return None
+
+        try:
+            start_dt = _fromisoformat(start_str)
+            end_dt = _fromisoformat(end_str) - timedelta(minutes=end_offset_minutes)
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+        return TimestampHelper.to_wall_clock_us(start_dt), TimestampHelper.to_wall_clock_us(end_dt)
+
+    @staticmethod
+    def is_overlap_batch(log_us: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """
+        Check many naive log times against many preparsed ranges at once.
+
+        Args:
+            log_us: wall-clock microseconds of each log (see to_wall_clock_us)
+            ranges: array of shape (n_ranges, 2) from preparse_range
+
+        Returns:
+            Boolean matrix of shape (n_logs, n_ranges)
+        """
+        log_us = np.asarray(log_us, dtype=np.int64)[:, None]
+        ranges = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+        return (log_us >= ranges[:, 0]) & (log_us <= ranges[:, 1])
@@ -1,7 +1,9 @@
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-import inspect
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import pathlib
 
 ROOT_DIR = pathlib.Path(__file__).resolve().parents[3]
@@ -19,28 +21,22 @@ formatter = logging.Formatter(
 # -------------------------------
 # Filter to add package | file
 # -------------------------------
+@functools.lru_cache(maxsize=4096)
+def _caller_path(filename: str) -> str:
+    """Path of a source file relative to ROOT_DIR, resolved once per file."""
+    p = pathlib.Path(filename).resolve()
+    try:
+        rel_path = p.relative_to(ROOT_DIR)
+    except ValueError:
+        rel_path = p
+    return str(rel_path)
 
-# -------------------------------
-# Filter to add package | file
-# -------------------------------
 class PackageFileFilter(logging.Filter):
     def filter(self, record):
-        for frame_info in inspect.stack()[1:]:
-            filename = frame_info.filename
-            if filename.endswith("logger.py") or "logging" in filename:
-                continue
-            
-            # Calculate relative path from ROOT_DIR
-            p = pathlib.Path(filename).resolve()
-            try:
-                rel_path = p.relative_to(ROOT_DIR)
-            except ValueError:
-                rel_path = p
-            
-            record.caller_path = str(rel_path)
-            break
-        else:
-            record.caller_path = "__unknown__"
+        # Logger.findCaller has already located the calling frame for
+        # record.pathname, so derive caller_path from it instead of walking
+        # the stack again
+        record.caller_path = _caller_path(record.pathname)
         return True
 
 
@@ -50,8 +46,8 @@ class PackageFileFilter(logging.Filter):
 logger = logging.getLogger("Agentic_tracking_system")
 logger.setLevel(LOG_LEVEL)
 
-# Add handlers only once
-if not logger.handlers:
+# Add handlers only once, even if this module is imported under several names
+if not any(isinstance(h, QueueHandler) for h in logger.handlers):
     # File handler with robust settings
     file_handler = RotatingFileHandler(
         str(LOG_FILE), 
@@ -61,15 +57,22 @@ if not logger.handlers:
         encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    file_handler.addFilter(PackageFileFilter())
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(PackageFileFilter())
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; a background thread formats and writes
+    # them, so file and console I/O never block the logging thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Runs in the logging thread, before the record is queued
+    queue_handler.addFilter(PackageFileFilter())
+    logger.addHandler(queue_handler)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    # Drain pending records before the interpreter exits
+    atexit.register(listener.stop)
 
 # Silence noisy libraries
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -9,7 +9,8 @@ from .session_mappers import (
     map_to_session_dtos,
     map_to_matched_session_dto,
     map_to_log_entry_dto,
-    parse_datetime
+    parse_datetime,
+    decode_session_dtos
 )
 from .alert_mappers import (
     map_to_device_alert_dto,
@@ -25,6 +26,7 @@ __all__ = [
     "map_to_matched_session_dto",
     "map_to_log_entry_dto",
     "parse_datetime",
+    "decode_session_dtos",
     "map_to_device_alert_dto",
     "map_to_identity_alert_dto",
     "map_to_timestamp_alert_dto",
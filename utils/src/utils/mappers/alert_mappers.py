@@ -5,6 +5,7 @@ This module contains functions for mapping raw dictionary data
 to alert Data Transfer Objects (DTOs).
 """
 
+import sys
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from utils import DeviceAlertDTO, IdentityAlertDTO, TimestampAlertDTO
@@ -28,6 +29,69 @@ def split_semicolon_list(value: Any, separator: str = ";") -> List[str]:
     return [s.strip() for s in value.split(separator.strip()) if s.strip()]
 
 
+def parse_reasons(value: Any) -> List[str]:
+    """
+    Normalize an alert 'reasons' value into a list of interned strings.
+
+    Reasons come from a small fixed vocabulary, so interning lets every
+    alert share one string object per reason instead of a fresh copy.
+
+    Args:
+        value: Semicolon-separated string, list, or single value
+
+    Returns:
+        List of reason strings
+    """
+    # Missing reasons are the common case, so test for them first
+    if value is None:
+        return []
+    if isinstance(value, str):
+        reasons = split_semicolon_list(value)
+    elif isinstance(value, list):
+        reasons = value
+    else:
+        reasons = [str(value)]
+    return [sys.intern(r) if isinstance(r, str) else r for r in reasons]
+
+
+def _to_ints(items) -> List[int]:
+    """Convert each item with int(), skipping the ones that do not parse."""
+    ints = []
+    add = ints.append
+    for item in items:
+        try:
+            add(int(item))
+        except (TypeError, ValueError):
+            pass
+    return ints
+
+
+def parse_int_list(value: Any) -> List[int]:
+    """
+    Normalize a list of integer ids (e.g. 'anomaly_sessions') given as a
+    semicolon-separated string or a list, dropping items that are not integers.
+
+    Args:
+        value: Semicolon-separated string or list
+
+    Returns:
+        List of integers
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        items = value.split(";")
+        # Well-formed lists convert in one C-level pass; int() also accepts
+        # the whitespace around items
+        try:
+            return list(map(int, items))
+        except ValueError:
+            return _to_ints(items)
+    if isinstance(value, list):
+        return _to_ints(value)
+    return []
+
+
 def map_to_device_alert_dto(data: Dict[str, Any]) -> DeviceAlertDTO:
     """
     Map raw dictionary data to DeviceAlertDTO.
@@ -38,16 +102,13 @@ def map_to_device_alert_dto(data: Dict[str, Any]) -> DeviceAlertDTO:
     Returns:
         DeviceAlertDTO instance
     """
-    reasons = data.get("reasons")
-    if isinstance(reasons, str):
-        reasons = split_semicolon_list(reasons)
-    elif not isinstance(reasons, list):
-        reasons = [str(reasons)] if reasons is not None else []
+    get = data.get
+    reasons = parse_reasons(get("reasons"))
         
     return DeviceAlertDTO(
-        id=int(data.get("id", 0)),
-        session_id=int(data.get("session_id", 0)),
-        device_id=data.get("device_id", ""),
+        id=int(get("id", 0)),
+        session_id=int(get("session_id", 0)),
+        device_id=get("device_id", ""),
         reasons=reasons
     )
 
@@ -62,26 +123,17 @@ def map_to_identity_alert_dto(data: Dict[str, Any]) -> IdentityAlertDTO:
     Returns:
         IdentityAlertDTO instance
     """
-    reasons = data.get("reasons")
-    if isinstance(reasons, str):
-        reasons = split_semicolon_list(reasons)
-    elif not isinstance(reasons, list):
-        reasons = [str(reasons)] if reasons is not None else []
+    get = data.get
+    reasons = parse_reasons(get("reasons"))
         
-    anomaly_sessions_raw = data.get("anomaly_sessions")
-    anomaly_sessions = []
-    if isinstance(anomaly_sessions_raw, str):
-        sessions_list = split_semicolon_list(anomaly_sessions_raw, separator=";")
-        anomaly_sessions = [int(s) for s in sessions_list if s.isdigit()]
-    elif isinstance(anomaly_sessions_raw, list):
-        anomaly_sessions = [int(s) for s in anomaly_sessions_raw if str(s).isdigit()]
+    anomaly_sessions = parse_int_list(get("anomaly_sessions"))
         
     return IdentityAlertDTO(
-        id=int(data.get("id", 0)),
-        uid=data.get("uid", ""),
-        device_id=data.get("device_id", ""),
-        normal_sessions_count=int(data.get("normal_sessions_count", 0)),
-        repeated_anomaly_count=int(data.get("repeated_anomaly_count", 0)),
+        id=int(get("id", 0)),
+        uid=get("uid", ""),
+        device_id=get("device_id", ""),
+        normal_sessions_count=int(get("normal_sessions_count", 0)),
+        repeated_anomaly_count=int(get("repeated_anomaly_count", 0)),
         anomaly_sessions=anomaly_sessions,
         reasons=reasons
     )
@@ -97,19 +149,16 @@ def map_to_timestamp_alert_dto(data: Dict[str, Any]) -> TimestampAlertDTO:
     Returns:
         TimestampAlertDTO instance
     """
-    reasons = data.get("reasons")
-    if isinstance(reasons, str):
-        reasons = split_semicolon_list(reasons)
-    elif not isinstance(reasons, list):
-        reasons = [str(reasons)] if reasons is not None else []
+    get = data.get
+    reasons = parse_reasons(get("reasons"))
         
-    timestamp = parse_datetime(data.get("timestamp"))
+    timestamp = parse_datetime(get("timestamp"))
     
     return TimestampAlertDTO(
-        id=int(data.get("id", 0)),
-        uid=data.get("uid", ""),
+        id=int(get("id", 0)),
+        uid=get("uid", ""),
         timestamp=timestamp,
-        session_id=int(data.get("session_id", 0)),
-        device_id=data.get("device_id", ""),
+        session_id=int(get("session_id", 0)),
+        device_id=get("device_id", ""),
         reasons=reasons
     )
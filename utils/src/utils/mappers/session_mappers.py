@@ -5,12 +5,23 @@ This module contains functions for mapping raw dictionary data
 to Data Transfer Objects (DTOs) used throughout the API.
 """
 
+import json
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 from utils import SessionDTO, MatchedSessionDTO, LogEntryDTO
 from utils import logger
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Decodes a JSON array of sessions straight into the DTO dataclasses in C
+_session_list_decoder = msgspec.json.Decoder(List[SessionDTO]) if MSGSPEC_AVAILABLE else None
+
 
 def parse_datetime(value: Any) -> Optional[datetime]:
     """
@@ -29,15 +40,24 @@ def parse_datetime(value: Any) -> Optional[datetime]:
         return value
     
     if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Failed to parse datetime value '{value}': {e}")
-            return None
+        return _parse_iso_datetime(value)
     
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO datetime string, memoized since the same timestamps recur
+    across sessions and alerts (datetimes are immutable, so sharing is safe).
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Failed to parse datetime value '{value}': {e}")
+        return None
+
+
 def map_to_matched_session_dto(data: Dict[str, Any]) -> MatchedSessionDTO:
     """
     Map raw dictionary data to MatchedSessionDTO.
@@ -48,11 +68,12 @@ def map_to_matched_session_dto(data: Dict[str, Any]) -> MatchedSessionDTO:
     Returns:
         MatchedSessionDTO instance
     """
+    get = data.get
     return MatchedSessionDTO(
-        id=data.get("id"),
-        summary=data.get("summary"),
-        start=data.get("start"),
-        end=data.get("end")
+        id=get("id"),
+        summary=get("summary"),
+        start=parse_datetime(get("start")),
+        end=parse_datetime(get("end"))
     )
 
 
@@ -72,6 +93,41 @@ def map_to_log_entry_dto(data: Dict[str, Any]) -> LogEntryDTO:
     )
 
 
+def _session_received_value(data: Dict[str, Any]) -> Any:
+    """The raw received_at of a session, falling back to 'logs_date' if missing."""
+    return data.get("received_at") or data.get("logs_date")
+
+
+def _build_session_dto(
+    data: Dict[str, Any],
+    received_at: Optional[datetime],
+    alert_count: int = 0,
+    alerts: List[Dict[str, Any]] = None
+) -> SessionDTO:
+    """
+    Build a SessionDTO from raw session data and its already parsed
+    received_at. Shared by the single and the batched mappers, so both
+    map every field the same way.
+    """
+    # Bind the lookup once; every field below is read with it
+    get = data.get
+    return SessionDTO(
+        session_id=get("session_id"),
+        device_id=get("device_id"),
+        session_context=get("session_context"),
+        matched_sessions=list(map(map_to_matched_session_dto, get("matched_sessions", []))),
+        received_at=received_at,
+        logs_date=get("logs_date"),
+        recorded_count=get("recorded_count"),
+        unique_count=get("unique_count"),
+        redundant_uids=get("redundant_uids", {}),
+        # Build entries positionally instead of one mapper call per log
+        logs=[LogEntryDTO(log.get("ts"), log.get("uid")) for log in get("logs", [])],
+        alert_count=alert_count,
+        alerts=alerts or []
+    )
+
+
 def map_to_session_dto(data: Dict[str, Any], alert_count: int = 0, alerts: List[Dict[str, Any]] = None) -> SessionDTO:
     """
     Map raw dictionary data to SessionDTO.
@@ -87,35 +143,8 @@ def map_to_session_dto(data: Dict[str, Any], alert_count: int = 0, alerts: List[
     Returns:
         SessionDTO instance
     """
-    # Map matched sessions
-    matched_raw = data.get("matched_sessions", [])
-    matched_dtos = [map_to_matched_session_dto(m) for m in matched_raw]
-    
-    # Map logs
-    logs_raw = data.get("logs", [])
-    logs_dtos = [map_to_log_entry_dto(log) for log in logs_raw]
-    
-    # Parse received_at datetime, fallback to 'logs_date' if missing
-    received_at_val = data.get("received_at")
-    if not received_at_val:
-        received_at_val = data.get("logs_date")
-    received_at = parse_datetime(received_at_val)
-    
-    # Create and return DTO
-    return SessionDTO(
-        session_id=data.get("session_id"),
-        device_id=data.get("device_id"),
-        session_context=data.get("session_context"),
-        matched_sessions=matched_dtos,
-        received_at=received_at,
-        logs_date=data.get("logs_date"),
-        recorded_count=data.get("recorded_count"),
-        unique_count=data.get("unique_count"),
-        redundant_uids=data.get("redundant_uids", {}),
-        logs=logs_dtos,
-        alert_count=alert_count,
-        alerts=alerts or []
-    )
+    received_at = parse_datetime(_session_received_value(data))
+    return _build_session_dto(data, received_at, alert_count, alerts)
 
 
 def map_to_session_dtos(data_list: List[Dict[str, Any]]) -> List[SessionDTO]:
@@ -128,4 +157,41 @@ def map_to_session_dtos(data_list: List[Dict[str, Any]]) -> List[SessionDTO]:
     Returns:
         List of SessionDTO instances
     """
-    return [map_to_session_dto(item) for item in data_list]
+    # Same mapping as map_to_session_dto, but each distinct received_at (or
+    # logs_date fallback) is parsed once for the whole list
+    received_values = [_session_received_value(item) for item in data_list]
+    received_ats = {value: parse_datetime(value) for value in set(received_values)}
+    return [
+        _build_session_dto(item, received_ats[value])
+        for item, value in zip(data_list, received_values)
+    ]
+
+
+def decode_session_dtos(content: bytes) -> List[SessionDTO]:
+    """
+    Decode a JSON array of sessions into SessionDTO instances.
+
+    With msgspec installed, conforming data is parsed and converted in one C
+    pass, without intermediate dicts or per-field lookups. Data the typed
+    decoder rejects (e.g. a missing received_at, which the mapper replaces
+    with logs_date) goes through map_to_session_dtos instead.
+
+    Args:
+        content: Raw JSON bytes
+
+    Returns:
+        List of SessionDTO instances
+
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if not MSGSPEC_AVAILABLE:
+        return map_to_session_dtos(json.loads(content))
+
+    try:
+        return _session_list_decoder.decode(content)
+    except msgspec.ValidationError:
+        return map_to_session_dtos(msgspec.json.decode(content))
+    except msgspec.DecodeError:
+        # e.g. NaN literals, which msgspec rejects but the json module accepts
+        return map_to_session_dtos(json.loads(content))
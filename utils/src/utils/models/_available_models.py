@@ -0,0 +1,54 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, FrozenSet, Tuple
+
+# Seconds a fetched model list is reused before the API is asked again
+AVAILABLE_MODELS_TTL = 300
+
+# (base_url, api key digest) -> (fetch time, served model ids), shared by
+# every model wrapper in the process
+_AVAILABLE_MODELS_CACHE: Dict[Tuple[str, str], Tuple[float, FrozenSet[str]]] = {}
+_cache_lock = threading.Lock()
+
+# Seconds a wrapper waits for a prefetched model list before falling back
+AVAILABLE_MODELS_TIMEOUT = 10
+
+# Background workers for model list lookups, so wrappers created back-to-back
+# (e.g. Gemini and Ragarenn) query their endpoints concurrently
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="models-list")
+
+
+def _key_digest(api_key: str) -> str:
+    """Short digest of the API key, so the raw key is never kept as a cache key."""
+    return hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest()
+
+
+def get_available_model_ids(client, base_url: str, api_key: str) -> FrozenSet[str]:
+    """
+    Return the model ids served at base_url for this API key, calling
+    client.models.list() at most once per AVAILABLE_MODELS_TTL seconds.
+    """
+    cache_key = (base_url, _key_digest(api_key))
+    cached = _AVAILABLE_MODELS_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < AVAILABLE_MODELS_TTL:
+        return cached[1]
+
+    with _cache_lock:
+        # Another thread may have refreshed the entry while we waited
+        cached = _AVAILABLE_MODELS_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < AVAILABLE_MODELS_TTL:
+            return cached[1]
+
+        model_ids = frozenset(model.id for model in client.models.list().data)
+        _AVAILABLE_MODELS_CACHE[cache_key] = (time.monotonic(), model_ids)
+        return model_ids
+
+
+def prefetch_available_model_ids(client, base_url: str, api_key: str) -> "Future[FrozenSet[str]]":
+    """
+    Start get_available_model_ids in the background and return its future,
+    so the lookup overlaps with the rest of the caller's startup.
+    """
+    return _PREFETCH_EXECUTOR.submit(get_available_model_ids, client, base_url, api_key)
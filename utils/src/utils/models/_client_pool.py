@@ -0,0 +1,29 @@
+import threading
+from typing import Dict, Optional, Tuple
+from openai import OpenAI
+from ._available_models import _key_digest
+
+# One OpenAI client (and so one httpx connection pool) per endpoint and
+# credentials, shared by every model wrapper in the process
+_CLIENTS: Dict[Tuple[str, str, Optional[int]], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str, base_url: str, max_retries: Optional[int] = None) -> OpenAI:
+    """
+    Return the shared OpenAI client for this API key, base URL and retry
+    setting, creating it on first use. Clients are thread-safe, so wrappers
+    can reuse their connections and TLS sessions.
+    """
+    cache_key = (base_url, _key_digest(api_key), max_retries)
+    client = _CLIENTS.get(cache_key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _CLIENTS.get(cache_key)
+        if client is None:
+            options = {} if max_retries is None else {"max_retries": max_retries}
+            client = OpenAI(api_key=api_key, base_url=base_url, **options)
+            _CLIENTS[cache_key] = client
+        return client
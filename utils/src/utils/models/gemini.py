@@ -1,8 +1,8 @@
 import os
-from openai import OpenAI
 from smolagents.models import OpenAIServerModel
 from utils import logger, Secrets
-from IPython.display import display, Markdown
+from ._available_models import AVAILABLE_MODELS_TIMEOUT, prefetch_available_model_ids
+from ._client_pool import get_openai_client
 from typing import Union, List
 
 class GeminiModel:
@@ -23,15 +23,27 @@ class GeminiModel:
             if not api_key:
                 raise EnvironmentError("Missing GOOGLE_API_KEY")
 
-            self.client = OpenAI(api_key=api_key, base_url=self.base_url)
+            self.client = get_openai_client(api_key, self.base_url)
             
-            # Select available model from the provided name(s)
-            self.model_name = self._select_available_model(model_name)
+            # Start checking which of the requested models are served; the
+            # choice is only made when model_name is first read
+            self._requested_models = model_name
+            self._model_name = None
+            self._models_future = None
+            if not isinstance(model_name, str) and len(model_name) > 1:
+                self._models_future = prefetch_available_model_ids(self.client, self.base_url, api_key)
             
         except Exception as e:
             logger.exception(f"Failed to initialize GeminiModel: {e}")
             raise
 
+    @property
+    def model_name(self) -> str:
+        """The selected model, resolved on first access."""
+        if self._model_name is None:
+            self._model_name = self._select_available_model(self._requested_models)
+        return self._model_name
+
     def _select_available_model(self, model_name: Union[str, List[str]]) -> str:
         """
         Select the first available model from the provided name(s).
@@ -47,11 +59,13 @@ class GeminiModel:
         """
         # Convert single string to list for uniform processing
         model_names = [model_name] if isinstance(model_name, str) else model_name
+
+        # With a single candidate the fallback picks it anyway, so skip the round-trip
+        if len(model_names) == 1:
+            return model_names[0]
         
         try:
-            # Fetch available models from the API
-            available_models_response = self.client.models.list()
-            available_model_ids = {model.id for model in available_models_response.data}
+            available_model_ids = self._models_future.result(timeout=AVAILABLE_MODELS_TIMEOUT)
             
             #logger.debug(f"Available models from API: {available_model_ids}")
             #logger.debug(f"Requested models: {model_names}")
@@ -74,7 +88,7 @@ class GeminiModel:
 
     def generate_text(self, prompt: str) -> str:
         """Send a text prompt to Gemini and return the response."""
-        logger.debug(f"Sending prompt to Gemini: {prompt[:80]}...")
+        logger.debug("Sending prompt to Gemini: %s...", prompt[:80])
         try:
             response = self.client.responses.create(
                 model=self.model_name,
@@ -91,6 +105,7 @@ class GeminiModel:
         """Ask Gemini a question and optionally display as Markdown."""
         answer = self.generate_text(prompt)
         if display_md:
+            from IPython.display import Markdown, display
             display(Markdown(answer))
         return answer
 
@@ -1,6 +1,7 @@
-from openai import OpenAI
 from smolagents.models import OpenAIServerModel
 from utils import logger, Secrets
+from ._available_models import AVAILABLE_MODELS_TIMEOUT, prefetch_available_model_ids
+from ._client_pool import get_openai_client
 from typing import Union, List
 
 class RagarennModel:
@@ -20,15 +21,27 @@ class RagarennModel:
             if not api_key:
                 raise EnvironmentError("Missing RENNES_API_KEY")
 
-            self.client = OpenAI(api_key=api_key, base_url=self.base_url, max_retries=self.retries)
+            self.client = get_openai_client(api_key, self.base_url, max_retries=self.retries)
             
-            # Select available model from the provided name(s)
-            self.model_name = self._select_available_model(target_model_name)
+            # Start checking which of the requested models are served; the
+            # choice is only made when model_name is first read
+            self._requested_models = target_model_name
+            self._model_name = None
+            self._models_future = None
+            if not isinstance(target_model_name, str) and len(target_model_name) > 1:
+                self._models_future = prefetch_available_model_ids(self.client, self.base_url, api_key)
 
         except Exception as e:
             logger.exception(f"Failed to initialize RagarennModel: {e}")
             raise
 
+    @property
+    def model_name(self) -> str:
+        """The selected model, resolved on first access."""
+        if self._model_name is None:
+            self._model_name = self._select_available_model(self._requested_models)
+        return self._model_name
+
     def _select_available_model(self, model_name: Union[str, List[str]]) -> str:
         """
         Select the first available model from the provided name(s).
@@ -44,11 +57,13 @@ class RagarennModel:
         """
         # Convert single string to list for uniform processing
         model_names = [model_name] if isinstance(model_name, str) else model_name
+
+        # With a single candidate the fallback picks it anyway, so skip the round-trip
+        if len(model_names) == 1:
+            return model_names[0]
         
         try:
-            # Fetch available models from the API
-            available_models_response = self.client.models.list()
-            available_model_ids = {model.id for model in available_models_response.data}
+            available_model_ids = self._models_future.result(timeout=AVAILABLE_MODELS_TIMEOUT)
             
             # Find the first available model
             for model in model_names:
@@ -82,9 +97,9 @@ class RagarennModel:
 
     def ask(self, prompt: str, display_md: bool = False) -> str:
         """Ask Ragarenn a question and optionally display as Markdown."""
-        from IPython.display import Markdown, display
         answer = self.generate_text(prompt)
         if display_md:
+            from IPython.display import Markdown, display
             display(Markdown(answer))
         return answer
 
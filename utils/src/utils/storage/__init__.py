@@ -4,6 +4,7 @@ from .json_repo import JsonRepository
 from .jsonl_repo import JsonlRepository
 from .csv_repo import CsvRepository
 from .ics_repo import IcsRepository
+from .parquet_repo import ParquetRepository
 
 __all__ = [
     "FileRepository",
@@ -12,4 +13,5 @@ __all__ = [
     "JsonlRepository",
     "CsvRepository",
     "IcsRepository",
+    "ParquetRepository",
 ]
@@ -1,8 +1,55 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 import os
+import threading
+
+# Buffer size for files read or written incrementally (rows, lines). Whole-file
+# reads and single-blob writes bypass the buffer, so they don't use it.
+IO_BUFFER_SIZE = 1 << 20
+
+# Records pulled from the iterable and written together by save_many
+SAVE_MANY_BATCH_SIZE = 50_000
+
+# Files up to this size keep a copy of their parsed records in memory
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Per file: the (mtime_ns, size) it was parsed at and its records, shared by
+# every repository instance so a write through one invalidates all of them
+_READ_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
+# Files at least this large get a sequential-access hint before being read
+SEQUENTIAL_HINT_MIN_BYTES = 1 << 20
+
+def advise_sequential(f) -> None:
+    """
+    Tell the kernel an open file is about to be read front to back, so it
+    reads ahead with a larger window while the caller parses. A no-op on
+    small files and where posix_fadvise is unavailable (Windows, macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = f.fileno()
+        if os.fstat(fd).st_size >= SEQUENTIAL_HINT_MIN_BYTES:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass  # Only a hint, e.g. not supported by the filesystem
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Split any iterable into lists of at most batch_size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
 
 class FileRepository(ABC):
+    # Set to True (on the class or an instance) to fsync each new version of
+    # the file before it replaces the old one, so a save survives a power
+    # loss. Off by default: the atomic replace already rules out torn files
+    # on a crash, and an fsync stalls every save on a disk flush.
+    durable = False
+
     def __init__(self, file_path: str):
         self.file_path = file_path
 
@@ -23,6 +70,60 @@ class FileRepository(ABC):
         if dir_path:
             os.makedirs(dir_path, exist_ok=True)
 
+    @contextmanager
+    def _atomic_path(self) -> Iterator[str]:
+        """
+        Yield a temporary path next to the file to write the new content to.
+        When the block completes it replaces the file in one os.replace, so
+        readers never see a half-written file and a failed write leaves the
+        old content intact. The name is unique per process and thread, so
+        concurrent savers never write into each other's temporary file.
+        """
+        tmp_path = self._temp_path()
+        try:
+            yield tmp_path
+            self._replace_with(tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _temp_path(self) -> str:
+        """Temporary path next to the file for this process and thread."""
+        return f"{self.file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+
+    def _replace_with(self, tmp_path: str) -> None:
+        """Make a fully written temporary file the new file (fsynced first if durable)."""
+        if self.durable:
+            # Opened for writing, which Windows requires to flush a file
+            fd = os.open(tmp_path, os.O_RDWR)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        os.replace(tmp_path, self.file_path)
+
+    def _cached_read(self, parse: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Return parse() for the file, reusing the records parsed last time if
+        the file's mtime and size are unchanged. Callers get their own copy
+        of each record, so mutating them never alters the cache.
+        """
+        path = os.path.abspath(self.file_path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _READ_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return list(map(dict.copy, cached[1]))
+
+        records = parse()
+        if stat.st_size <= READ_CACHE_MAX_BYTES:
+            _READ_CACHE[path] = (signature, list(map(dict.copy, records)))
+        return records
+
+    def _invalidate_read_cache(self) -> None:
+        """Drop the cached records after writing to the file."""
+        _READ_CACHE.pop(os.path.abspath(self.file_path), None)
+
     @abstractmethod
     def read_all(self) -> List[Dict[str, Any]]:
         """Read all records from the file."""
@@ -49,6 +150,48 @@ class FileRepository(ABC):
         """
         pass
 
+    def update_many(self, updates_by_id: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Apply several updates with one read and one write of the file.
+        As with update(), only the first record holding each id is changed.
+        Returns the number of records updated.
+        """
+        data = self.read_all()
+        if not isinstance(data, list):
+            return 0
+
+        pending = {str(record_id): updates for record_id, updates in updates_by_id.items()}
+        updated = 0
+        for record in data:
+            if not pending:
+                break
+            if isinstance(record, dict):
+                updates = pending.pop(str(record.get('id')), None)
+                if updates is not None:
+                    record.update(updates)
+                    updated += 1
+
+        if updated:
+            self.save_all(data)
+        return updated
+
+    def delete_many(self, record_ids: Iterable[str]) -> int:
+        """
+        Delete every record whose id is in record_ids with one read and one
+        write of the file. Returns the number of records deleted.
+        """
+        data = self.read_all()
+        if not isinstance(data, list):
+            return 0
+
+        targets = {str(record_id) for record_id in record_ids}
+        kept = [r for r in data if not isinstance(r, dict) or str(r.get('id')) not in targets]
+
+        deleted = len(data) - len(kept)
+        if deleted:
+            self.save_all(kept)
+        return deleted
+
     @abstractmethod
     def get_schema_info(self) -> Dict[str, Any]:
         """
@@ -1,19 +1,76 @@
 import csv
+import io
 import os
-from typing import List, Dict, Any, Union
-from .base import FileRepository
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from .base import FileRepository, IO_BUFFER_SIZE, SAVE_MANY_BATCH_SIZE, advise_sequential, iter_batches
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Files smaller than this are parsed faster by csv.DictReader than by Arrow
+PYARROW_MIN_READ_BYTES = 256 * 1024
+# Bytes per block handed to Arrow's multithreaded CSV parser
+PYARROW_READ_BLOCK_SIZE = 8 << 20
+
+# Per CSV file: the (mtime_ns, size) it was indexed at, and the byte
+# (offset, length) of the first row holding each id
+_ROW_INDEXES: Dict[str, Tuple[Tuple[int, int], Dict[str, Tuple[int, int]]]] = {}
 
 class CsvRepository(FileRepository):
-    def read_all(self) -> List[Dict[str, Any]]:
+    def read_all(self, fast: bool = True) -> List[Dict[str, Any]]:
+        """
+        Read all rows as dictionaries of strings.
+
+        Args:
+            fast: Parse large files with pyarrow when it is installed.
+                  Pass False to always use csv.DictReader.
+        """
         self.ensure_exists()
         try:
-            with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                return list(reader)
+            return self._cached_read(lambda: self._parse(fast))
         except Exception:
             return []
 
+    def _parse(self, fast: bool) -> List[Dict[str, Any]]:
+        """Parse the whole file, see read_all."""
+        if fast and PYARROW_AVAILABLE and os.path.getsize(self.file_path) >= PYARROW_MIN_READ_BYTES:
+            try:
+                return self._read_arrow()
+            except (pa.ArrowException, ValueError):
+                pass  # Ragged rows or duplicate headers, use the stdlib reader
+
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            return list(reader)
+
+    def _read_arrow(self) -> List[Dict[str, Any]]:
+        """
+        Parse the file with pyarrow's multithreaded CSV reader. Every column is
+        read as a non-null string so rows match what csv.DictReader returns.
+        """
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
+            fieldnames = next(csv.reader(f), None)
+        if not fieldnames or len(set(fieldnames)) != len(fieldnames):
+            raise ValueError("CSV header is missing or has duplicate names")
+
+        table = pa_csv.read_csv(
+            self.file_path,
+            read_options=pa_csv.ReadOptions(block_size=PYARROW_READ_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in fieldnames},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False
+            )
+        )
+        return table.to_pylist()
+
     def _save(self, data: List[Dict[str, Any]]):
+        self._invalidate_read_cache()
         if not data:
             # If empty, create an empty file
             self.ensure_directory_exists()
@@ -23,49 +80,236 @@ class CsvRepository(FileRepository):
         # Ensure directory exists
         self.ensure_directory_exists()
             
-        fieldnames = data[0].keys()
-        with open(self.file_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        # Always written by csv.writer, so the file's quoting and value
+        # formatting never depend on the row count or on pyarrow
+        fieldnames = list(data[0].keys())
+        with self._atomic_path() as tmp_path:
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                self._write_rows(writer, data, fieldnames)
+
+    @staticmethod
+    def _write_rows(writer, data: List[Dict[str, Any]], fieldnames: List[str]):
+        """
+        Same output as csv.DictWriter, but rows are flattened to lists in one
+        comprehension instead of one DictWriter call per row.
+        """
+        known_fields = frozenset(fieldnames)
+        for record in data:
+            if not record.keys() <= known_fields:
+                extra_fields = record.keys() - known_fields
+                raise ValueError("dict contains fields not in fieldnames: " + ", ".join(repr(x) for x in extra_fields))
+        writer.writerows([[record.get(field) for field in fieldnames] for record in data])
+
+    def iter_all(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield rows one at a time as dictionaries of strings, without loading
+        the whole file.
+        """
+        self.ensure_exists()
+        with open(self.file_path, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            yield from csv.DictReader(f)
+
+    def _read_header(self) -> Optional[List[str]]:
+        """Return the header row, or None if the file is empty."""
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
+            return next(csv.reader(f), None) or None
 
     def add(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        records = data if isinstance(data, list) else [data]
+        self.ensure_exists()
+        header = self._read_header()
+
+        # Append below the existing rows when the new records fit the header,
+        # instead of reading and rewriting the whole file
+        known_fields = set(header or ())
+        if header and all(record.keys() <= known_fields for record in records):
+            with open(self.file_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                missing_newline = f.read(1) not in (b'\n', b'\r')
+            self._invalidate_read_cache()
+            with open(self.file_path, 'a', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                if missing_newline:
+                    f.write(writer.dialect.lineterminator)
+                self._write_rows(writer, records, header)
+            return
+
         current_data = self.read_all()
-        if isinstance(data, list):
-            current_data.extend(data)
-        else:
-            current_data.append(data)
+        current_data.extend(records)
         self._save(current_data)
 
+    def _rewrite_matching(self, record_id: str, replace, first_only: bool = False) -> bool:
+        """
+        Stream the file into a temporary copy in which each row whose 'id'
+        equals record_id is passed through replace(record), which returns the
+        new record or None to drop the row. The copy replaces the file only
+        if a row matched, and memory use stays constant whatever the file size.
+        """
+        self.ensure_exists()
+        tmp_path = self._temp_path()
+        matched = False
+        try:
+            with open(self.file_path, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as src, \
+                    open(tmp_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as dst:
+                reader = csv.reader(src)
+                header = next(reader, None)
+                if not header or 'id' not in header:
+                    return False
+                id_index = header.index('id')
+
+                def rows():
+                    nonlocal matched
+                    for row in reader:
+                        if len(row) > id_index and row[id_index] == record_id and not (first_only and matched):
+                            matched = True
+                            record = replace(dict(zip(header, row)))
+                            if record is None:
+                                continue
+                            row = [record.get(field) for field in header]
+                        yield row
+
+                writer = csv.writer(dst)
+                writer.writerow(header)
+                writer.writerows(rows())
+
+            if matched:
+                self._invalidate_read_cache()
+                self._replace_with(tmp_path)
+            return matched
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _row_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Map each id to the byte (offset, length) of its first row. The index
+        is built with one scan and reused until the file's size or mtime change.
+        """
+        path = os.path.abspath(self.file_path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _ROW_INDEXES.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index = {}
+        id_index = None
+        offset = start = 0
+        record = b''
+        with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for line in f:
+                if not record:
+                    start = offset
+                record += line
+                offset += len(line)
+                if record.count(b'"') % 2:
+                    continue  # Line break inside a quoted field, the row goes on
+                row = next(csv.reader([record.decode('utf-8')]), [])
+                record = b''
+                if id_index is None:
+                    if 'id' not in row:
+                        break
+                    id_index = row.index('id')
+                elif len(row) > id_index:
+                    index.setdefault(row[id_index], (start, offset - start))
+
+        _ROW_INDEXES[path] = (signature, index)
+        return index
+
+    def _update_in_place(self, record_id: str, updates: Dict[str, Any], header: List[str]) -> bool:
+        """
+        Overwrite the row's bytes in place when the updated row serializes to
+        the same length. Returns False if it does not fit.
+        """
+        offset, length = self._row_index()[record_id]
+        with open(self.file_path, 'r+b') as f:
+            f.seek(offset)
+            text = f.read(length).decode('utf-8')
+            record = dict(zip(header, next(csv.reader([text]))))
+            record.update(updates)
+
+            line_end = text[len(text.rstrip('\r\n')):]
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator=line_end).writerow([record.get(field) for field in header])
+            new_bytes = buffer.getvalue().encode('utf-8')
+            if len(new_bytes) != length:
+                return False
+            self._invalidate_read_cache()
+            f.seek(offset)
+            f.write(new_bytes)
+
+        # Offsets are unchanged, so keep the index unless an id was rewritten
+        path = os.path.abspath(self.file_path)
+        if 'id' in updates:
+            _ROW_INDEXES.pop(path, None)
+        else:
+            stat = os.stat(path)
+            _ROW_INDEXES[path] = ((stat.st_mtime_ns, stat.st_size), _ROW_INDEXES[path][1])
+        return True
+
     def update(self, record_id: str, updates: Dict[str, Any]) -> bool:
-        data = self.read_all()
-        updated = False
-        for i, record in enumerate(data):
-            if str(record.get('id')) == str(record_id):
-                data[i].update(updates)
-                updated = True
-                break
-        
-        if updated:
-            self._save(data)
-        return updated
+        def apply_updates(record):
+            record.update(updates)
+            return record
 
-    def delete(self, record_id: str) -> bool:
+        record_id = str(record_id)
+        header = self._read_header() if os.path.exists(self.file_path) else None
+        if header and 'id' in header and updates.keys() <= set(header):
+            if record_id not in self._row_index():
+                return False
+            if self._update_in_place(record_id, updates, header):
+                return True
+            return self._rewrite_matching(record_id, apply_updates, first_only=True)
+
+        # Updates adding columns change the header, so rewrite the whole file
+        # CSV values are read back as strings, so ids compare without coercion
         data = self.read_all()
-        initial_len = len(data)
-        data = [r for r in data if str(r.get('id')) != str(record_id)]
-        
-        if len(data) < initial_len:
-            self._save(data)
-            return True
+        for record in data:
+            if record.get('id') == record_id:
+                record.update(updates)
+                self._save(data)
+                return True
         return False
 
+    def delete(self, record_id: str) -> bool:
+        record_id = str(record_id)
+        if record_id not in self._row_index():
+            return False
+        return self._rewrite_matching(record_id, lambda record: None)
+
     def save_all(self, data: List[Dict[str, Any]]) -> None:
         """
         Overwrite the file with the provided list of records.
         """
         self._save(data)
 
+    def save_many(self, records: Iterable[Dict[str, Any]], batch_size: int = SAVE_MANY_BATCH_SIZE) -> int:
+        """
+        Overwrite the file with records pulled from any iterable (e.g. a
+        generator), so only one batch is held in memory at a time. The
+        header comes from the first record, as in save_all.
+
+        Returns:
+            Number of records written
+        """
+        self.ensure_directory_exists()
+        self._invalidate_read_cache()
+        count = 0
+        with self._atomic_path() as tmp_path:
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                fieldnames = None
+                for batch in iter_batches(records, batch_size):
+                    if fieldnames is None:
+                        fieldnames = list(batch[0].keys())
+                        writer.writerow(fieldnames)
+                    self._write_rows(writer, batch, fieldnames)
+                    count += len(batch)
+        return count
+
     def get_schema_info(self) -> Dict[str, Any]:
         """
         Get schema information about the CSV file.
@@ -82,18 +326,15 @@ class CsvRepository(FileRepository):
             # Get field names from the first record
             fieldnames = list(data[0].keys()) if data else []
             
-            # Analyze all records to determine types
-            schema = {}
-            for field in fieldnames:
-                schema[field] = {"type": "unknown"}
-            
-            for record in data:
-                for field, value in record.items():
-                    if field in schema:
-                        inferred_type = self._infer_type(value)
-                        # Update type if we find a more specific type
-                        if schema[field]["type"] == "unknown" or inferred_type != "str":
-                            schema[field] = {"type": inferred_type}
+            # A column's type is that of its last non-'str' cell, or 'str' if
+            # it only holds strings, so each column is scanned backwards and
+            # usually stops at its last row. Cells repeat a lot (ids, device
+            # names, flags), so each distinct value is inferred once
+            inferred_types = {}
+            schema = {
+                field: {"type": self._infer_column_type(data, field, inferred_types)}
+                for field in fieldnames
+            }
             
             # Find the best sample (row with most non-empty values)
             best_sample = data[0]
@@ -113,6 +354,25 @@ class CsvRepository(FileRepository):
         except Exception:
             return {"fields": [], "schema": {}, "sample": None}
 
+    def _infer_column_type(self, data: List[Dict[str, Any]], field: str, inferred_types: Dict[Any, str]) -> str:
+        """
+        Infer the type of one column: the type of its last cell that is not
+        a plain string, else 'str' if the column has cells, else 'unknown'.
+        inferred_types memoizes _infer_type across calls.
+        """
+        column_type = "unknown"
+        for record in reversed(data):
+            if field not in record:
+                continue
+            value = record[field]
+            inferred_type = inferred_types.get(value)
+            if inferred_type is None:
+                inferred_type = inferred_types[value] = self._infer_type(value)
+            if inferred_type != "str":
+                return inferred_type
+            column_type = "str"
+        return column_type
+
     def _infer_type(self, value: str) -> str:
         """
         Infer the type of a CSV value (all CSV values are strings).
@@ -125,6 +385,13 @@ class CsvRepository(FileRepository):
         if value.lower() in ("true", "false"):
             return "bool"
         
+        # Plain digit strings are ints, and a leading letter rules out both
+        # numbers (float also reads inf/infinity/nan), without raising
+        if value.isdecimal():
+            return "int"
+        if value[0].isalpha() and value[0] not in "iInN":
+            return "str"
+
         # Check for integer
         try:
             int(value)
@@ -1,25 +1,43 @@
 import os
+from typing import Dict, Tuple, Type
 from .base import FileRepository
 from .json_repo import JsonRepository
 from .jsonl_repo import JsonlRepository
 from .csv_repo import CsvRepository
 from .ics_repo import IcsRepository
+from .parquet_repo import ParquetRepository
+
+# Repository per (working directory, file path). Repositories only hold their
+# path (and whether it was seen to exist), so one instance per file is shared
+# by all callers in the process instead of being rebuilt on every call. The
+# working directory is part of the key because relative paths resolve against it
+_INSTANCES: Dict[Tuple[str, str], FileRepository] = {}
 
 class RepositoryFactory:
+    # Repository class for each supported file extension; new formats only
+    # need an entry here
+    _REPOSITORIES: Dict[str, Type[FileRepository]] = {
+        '.json': JsonRepository,
+        '.jsonl': JsonlRepository,
+        '.csv': CsvRepository,
+        '.ics': IcsRepository,
+        '.parquet': ParquetRepository,
+    }
+
     @staticmethod
     def get_repository(file_path: str) -> FileRepository:
         """
         Returns the appropriate FileRepository based on the file extension.
+        Repeated calls for the same file return the same instance.
         """
+        key = (os.getcwd(), file_path)
+        repository = _INSTANCES.get(key)
+        if repository is not None:
+            return repository
+
         ext = os.path.splitext(file_path)[1].lower()
-        
-        if ext == '.json':
-            return JsonRepository(file_path)
-        elif ext == '.jsonl':
-            return JsonlRepository(file_path)
-        elif ext == '.csv':
-            return CsvRepository(file_path)
-        elif ext == '.ics':
-            return IcsRepository(file_path)
-        else:
+        repository_cls = RepositoryFactory._REPOSITORIES.get(ext)
+        if repository_cls is None:
             raise ValueError(f"Unsupported file format: {ext}")
+        # setdefault keeps a single instance if two threads race here
+        return _INSTANCES.setdefault(key, repository_cls(file_path))
@@ -1,7 +1,9 @@
 import os
-from typing import List, Dict, Any, Union
-from datetime import datetime
-from .base import FileRepository
+import shutil
+from typing import List, Dict, Any, Optional, Union
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from .base import FileRepository, IO_BUFFER_SIZE, advise_sequential
 from ..helpers.time import TimestampHelper
 
 try:
@@ -10,6 +12,150 @@ try:
 except ImportError:
     ICALENDAR_AVAILABLE = False
 
+# Closing line of a calendar; add() inserts new events just before it
+CALENDAR_END = b"END:VCALENDAR"
+# Bytes read from the end of the file when looking for that line
+ICS_TAIL_BYTES = 4096
+
+# VEVENT properties read_all extracts
+_EVENT_PROPERTIES = frozenset({"UID", "SUMMARY", "DTSTART", "DTEND", "DESCRIPTION"})
+
+# Backslash escapes of iCalendar TEXT values (RFC 5545, 3.3.11)
+_TEXT_ESCAPES = {"\\\\": "\\", "\\;": ";", "\\,": ",", "\\n": "\n", "\\N": "\n"}
+
+
+class _UnsupportedCalendar(Exception):
+    """Raised by the event scanner for input it leaves to icalendar."""
+
+
+def _unfold(text: str) -> List[str]:
+    """Split ICS text into content lines, joining folded continuation lines."""
+    lines = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if line[:1] in (" ", "\t") and lines:
+            lines[-1] += line[1:]
+        elif line:
+            lines.append(line)
+    return lines
+
+
+def _split_property(line: str):
+    """Split 'NAME;PARAM=VALUE:value' into (NAME, {PARAM: VALUE}, value)."""
+    colon = line.find(":")
+    head = line[:colon]
+    if '"' in head:
+        # A quoted parameter value may itself contain ':'
+        in_quotes = False
+        colon = -1
+        for index, char in enumerate(line):
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ":" and not in_quotes:
+                colon = index
+                break
+        head = line[:colon]
+    if colon < 0:
+        raise _UnsupportedCalendar(line)
+
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, value = param.partition("=")
+        parameters[key.upper()] = value.strip('"')
+    return name.upper(), parameters, line[colon + 1:]
+
+
+def _unescape_text(value: str) -> str:
+    if "\\" not in value:
+        return value
+    out = []
+    index = 0
+    while index < len(value):
+        pair = value[index:index + 2]
+        if pair in _TEXT_ESCAPES:
+            out.append(_TEXT_ESCAPES[pair])
+            index += 2
+        else:
+            out.append(value[index])
+            index += 1
+    return "".join(out)
+
+
+def _parse_date_time(value: str, parameters: Dict[str, str]) -> Union[date, datetime]:
+    """Parse a DATE or DATE-TIME value the way icalendar does for .dt."""
+    try:
+        if parameters.get("VALUE", "").upper() == "DATE" or len(value) == 8:
+            return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        if len(value) not in (15, 16) or value[8] != "T" or (len(value) == 16 and value[15] != "Z"):
+            raise _UnsupportedCalendar(value)
+        dt = datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                      int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    except ValueError:
+        raise _UnsupportedCalendar(value)
+
+    if value.endswith("Z"):
+        return dt.replace(tzinfo=timezone.utc)
+    tzid = parameters.get("TZID")
+    if tzid:
+        try:
+            return dt.replace(tzinfo=ZoneInfo(tzid))
+        except (ZoneInfoNotFoundError, ValueError):
+            raise _UnsupportedCalendar(tzid)  # e.g. a Windows zone name or a custom VTIMEZONE
+    return dt
+
+
+def _scan_events(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract the fields read_all needs from every VEVENT with plain string
+    operations, without building icalendar's component tree. Raises
+    _UnsupportedCalendar for input it cannot interpret exactly like icalendar.
+    """
+    events = []
+    stack = []
+    event = None
+    for line in _unfold(text):
+        upper = line[:6].upper()
+        if upper == "BEGIN:":
+            stack.append(line[6:].strip().upper())
+            if stack[-1] == "VEVENT":
+                event = {}
+            continue
+        if upper[:4] == "END:":
+            name = stack.pop() if stack else None
+            if name == "VEVENT":
+                events.append(event)
+                event = None
+            continue
+        if not stack or stack[-1] != "VEVENT":
+            continue  # Calendar-level properties, or those of a VALARM inside the event
+
+        name, parameters, value = _split_property(line)
+        if name not in _EVENT_PROPERTIES:
+            continue
+        if name in event:
+            raise _UnsupportedCalendar(name)  # icalendar would return a list
+        event[name] = (parameters, value)
+
+    if stack:
+        raise _UnsupportedCalendar("unterminated component")
+
+    sessions = []
+    for event in events:
+        start = end = None
+        if "DTSTART" in event:
+            start = _parse_date_time(event["DTSTART"][1], event["DTSTART"][0])
+        if "DTEND" in event:
+            end = _parse_date_time(event["DTEND"][1], event["DTEND"][0])
+        description = _unescape_text(event["DESCRIPTION"][1]) if "DESCRIPTION" in event else ""
+        sessions.append({
+            "id": _unescape_text(event["UID"][1]) if "UID" in event else "None",
+            "summary": _unescape_text(event["SUMMARY"][1]) if "SUMMARY" in event else "None",
+            "start": start,
+            "end": end,
+            "description": description,
+        })
+    return sessions
+
 class IcsRepository(FileRepository):
     def __init__(self, file_path: str):
         super().__init__(file_path)
@@ -18,28 +164,45 @@ class IcsRepository(FileRepository):
 
     def read_all(self) -> List[Dict[str, Any]]:
         self.ensure_exists()
-        
+        return self._cached_read(self._parse)
+
+    def _parse(self) -> List[Dict[str, Any]]:
+        """Parse every VEVENT of the calendar into a record."""
         with open(self.file_path, 'rb') as f:
-            cal = Calendar.from_ical(f.read())
-            sessions = []
-            for component in cal.walk():
-                if component.name == "VEVENT":
-                    session_dict = {
-                        "id": str(component.get("UID")),
-                        "summary": str(component.get("SUMMARY")),
-                        "start": component.get("DTSTART").dt if component.get("DTSTART") else None,
-                        "end": component.get("DTEND").dt if component.get("DTEND") else None,
-                        "description": str(component.get("DESCRIPTION")) if component.get("DESCRIPTION") else "",
-                    }
-                    # Convert datetimes to desired format using TimestampHelper
-                    if session_dict["start"]:
-                        # safe_parse expects a string, so we convert datetime/date to string first
-                        session_dict["start"] = TimestampHelper.safe_parse(str(session_dict["start"]))
-                    if session_dict["end"]:
-                        session_dict["end"] = TimestampHelper.safe_parse(str(session_dict["end"]))
-                        
-                    sessions.append(session_dict)
-            return sessions
+            advise_sequential(f)
+            content = f.read()
+
+        # Scan the few fields we need directly; anything the scanner cannot
+        # interpret exactly like icalendar goes through the full parser
+        try:
+            sessions = _scan_events(content.decode("utf-8"))
+        except (_UnsupportedCalendar, UnicodeDecodeError):
+            sessions = self._parse_with_icalendar(content)
+
+        for session_dict in sessions:
+            # Convert datetimes to desired format using TimestampHelper
+            if session_dict["start"]:
+                # safe_parse expects a string, so we convert datetime/date to string first
+                session_dict["start"] = TimestampHelper.safe_parse(str(session_dict["start"]))
+            if session_dict["end"]:
+                session_dict["end"] = TimestampHelper.safe_parse(str(session_dict["end"]))
+        return sessions
+
+    @staticmethod
+    def _parse_with_icalendar(content: bytes) -> List[Dict[str, Any]]:
+        """Extract the VEVENT fields through icalendar's component tree."""
+        cal = Calendar.from_ical(content)
+        sessions = []
+        for component in cal.walk():
+            if component.name == "VEVENT":
+                sessions.append({
+                    "id": str(component.get("UID")),
+                    "summary": str(component.get("SUMMARY")),
+                    "start": component.get("DTSTART").dt if component.get("DTSTART") else None,
+                    "end": component.get("DTEND").dt if component.get("DTEND") else None,
+                    "description": str(component.get("DESCRIPTION")) if component.get("DESCRIPTION") else "",
+                })
+        return sessions
 
     def get_ending_events(self, window_seconds: int = 60) -> List[Dict[str, Any]]:
         """
@@ -68,55 +231,103 @@ class IcsRepository(FileRepository):
     def save_all(self, data: List[Dict[str, Any]]):
         self._save(data)
 
+    @staticmethod
+    def _to_event(item: Dict[str, Any]) -> "Event":
+        """Build the VEVENT component for one record."""
+        session = Event()
+        session.add('uid', item.get('id'))
+        session.add('summary', item.get('summary'))
+        session.add('description', item.get('description', ''))
+        
+        # Basic datetime handling - assumes ISO strings or datetime objects
+        start = item.get('start')
+        if isinstance(start, str):
+            try:
+                start = datetime.fromisoformat(start)
+            except ValueError:
+                pass # Handle or log error
+        if start:
+            session.add('dtstart', start)
+
+        end = item.get('end')
+        if isinstance(end, str):
+            try:
+                end = datetime.fromisoformat(end)
+            except ValueError:
+                pass
+        if end:
+            session.add('dtend', end)
+
+        return session
+
     def _save(self, data: List[Dict[str, Any]]):
         cal = Calendar()
         cal.add('prodid', '-//My Calendar Product//mxm.dk//')
         cal.add('version', '2.0')
 
         for item in data:
-            session = Event()
-            session.add('uid', item.get('id'))
-            session.add('summary', item.get('summary'))
-            session.add('description', item.get('description', ''))
-            
-            # Basic datetime handling - assumes ISO strings or datetime objects
-            start = item.get('start')
-            if isinstance(start, str):
-                try:
-                    start = datetime.fromisoformat(start)
-                except ValueError:
-                    pass # Handle or log error
-            if start:
-                session.add('dtstart', start)
-
-            end = item.get('end')
-            if isinstance(end, str):
-                try:
-                    end = datetime.fromisoformat(end)
-                except ValueError:
-                    pass
-            if end:
-                session.add('dtend', end)
-
-            cal.add_component(session)
+            cal.add_component(self._to_event(item))
 
         self.ensure_directory_exists()
-        with open(self.file_path, 'wb') as f:
-            f.write(cal.to_ical())
+        self._invalidate_read_cache()
+        with self._atomic_path() as tmp_path:
+            with open(tmp_path, 'wb') as f:
+                f.write(cal.to_ical())
+
+    def _calendar_end_offset(self) -> Optional[int]:
+        """
+        Byte offset of the closing END:VCALENDAR line, found by reading only
+        the end of the file. None if the file does not end with one.
+        """
+        with open(self.file_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - ICS_TAIL_BYTES)
+            f.seek(start)
+            tail = f.read()
+        index = tail.rfind(CALENDAR_END)
+        if index < 0 or tail[index + len(CALENDAR_END):].strip():
+            return None
+        if index > 0 and tail[index - 1:index] != b'\n':
+            return None
+        if index == 0 and start > 0:
+            return None  # Cannot tell whether the marker starts a line
+        return start + index
 
     def add(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        records = data if isinstance(data, list) else [data]
+        self.ensure_exists()
+
+        # Insert the new events before the closing END:VCALENDAR line instead
+        # of parsing and re-serializing the whole calendar. The bytes are
+        # copied into a temporary file that then replaces the calendar, so
+        # an interrupted add never leaves it without its closing line
+        end_offset = self._calendar_end_offset()
+        if end_offset is not None:
+            events = b"".join(self._to_event(item).to_ical() for item in records)
+            self._invalidate_read_cache()
+            with open(self.file_path, 'rb') as src, self._atomic_path() as tmp_path:
+                with open(tmp_path, 'wb') as dst:
+                    remaining = end_offset
+                    while remaining:
+                        chunk = src.read(min(remaining, IO_BUFFER_SIZE))
+                        if not chunk:
+                            break
+                        remaining -= len(chunk)
+                        dst.write(chunk)
+                    dst.write(events)
+                    shutil.copyfileobj(src, dst, IO_BUFFER_SIZE)
+            return
+
         current_data = self.read_all()
-        if isinstance(data, list):
-            current_data.extend(data)
-        else:
-            current_data.append(data)
+        current_data.extend(records)
         self._save(current_data)
 
     def update(self, record_id: str, updates: Dict[str, Any]) -> bool:
+        target = str(record_id)
         data = self.read_all()
         updated = False
         for i, record in enumerate(data):
-            if str(record.get('id')) == str(record_id):
+            if record.get('id') == target:
                 data[i].update(updates)
                 updated = True
                 break
@@ -126,9 +337,10 @@ class IcsRepository(FileRepository):
         return updated
 
     def delete(self, record_id: str) -> bool:
+        target = str(record_id)
         data = self.read_all()
         initial_len = len(data)
-        data = [r for r in data if str(r.get('id')) != str(record_id)]
+        data = [r for r in data if r.get('id') != target]
         
         if len(data) < initial_len:
             self._save(data)
@@ -146,6 +358,7 @@ class IcsRepository(FileRepository):
             if isinstance(content, bytes):
                 content = content.decode("utf-8", errors="ignore")
 
+            self._invalidate_read_cache()
             with open(self.file_path, "w", encoding="utf-8") as f:
                 f.write(content)
 
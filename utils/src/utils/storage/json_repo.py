@@ -1,15 +1,86 @@
 import json
+import math
 import os
-from typing import List, Dict, Any, Union, Optional
-from .base import FileRepository
+from typing import List, Dict, Any, Iterator, Union, Optional
+from .base import FileRepository, IO_BUFFER_SIZE, advise_sequential
 from ..logger import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Collections at least this large are streamed one record at a time by
+# get_by_id and get_schema_info (when ijson is installed) instead of being
+# loaded whole, so memory stays at one record rather than the whole file
+JSON_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Schema type of the scalar values JSON decodes to, looked up by exact type
+# before the isinstance checks in _get_type_info
+_SCALAR_TYPE_NAMES = {bool: "bool", int: "int", float: "float", str: "str", type(None): "null"}
+
+
+def _loads(content: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib json accepts
+            pass
+    return json.loads(content)
+
+
+def _non_finite_to_null(value: Any) -> Any:
+    """Copy of value with NaN and Infinity floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _non_finite_to_null(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_non_finite_to_null(item) for item in value]
+    return value
+
+
+def _dumps_compact(data: Any) -> bytes:
+    """
+    Encode data as compact JSON (no whitespace, NaN and Infinity as null),
+    in the same format with or without orjson.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    try:
+        text = json.dumps(data, separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # Out of range float values, written as null like orjson does
+        text = json.dumps(_non_finite_to_null(data), separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
 class JsonRepository(FileRepository):
     """
     Repository for JSON files supporting both record collections (lists) 
     and single objects (dicts).
     """
 
+    def __init__(self, file_path: str, pretty: bool = True):
+        """
+        Args:
+            file_path: Path of the JSON file.
+            pretty: Write indented JSON (4 spaces, by the stdlib encoder).
+                    Pass False for large machine-read files, which are
+                    then written compact (about half the bytes), with NaN
+                    and Infinity as null, and parse faster.
+        """
+        super().__init__(file_path)
+        self.pretty = pretty
+
     def read(self, default: Any = None) -> Any:
         """
         Read the entire JSON content from the file.
@@ -23,11 +94,53 @@ class JsonRepository(FileRepository):
         """
         try:
             self.ensure_exists()
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.file_path, 'rb') as f:
+                advise_sequential(f)
+                return _loads(f.read())
         except (json.JSONDecodeError, FileNotFoundError):
             return default if default is not None else {}
 
+    def read_bytes(self) -> bytes:
+        """
+        Read the raw JSON bytes, for callers that decode them directly
+        (e.g. into typed objects) instead of into dicts and lists.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        self.ensure_exists()
+        with open(self.file_path, 'rb') as f:
+            advise_sequential(f)
+            return f.read()
+
+    def _is_streamable(self) -> bool:
+        """True if the file is a large top-level array that ijson can stream."""
+        if not IJSON_AVAILABLE:
+            return False
+        try:
+            if os.path.getsize(self.file_path) < JSON_STREAM_MIN_BYTES:
+                return False
+            with open(self.file_path, 'rb') as f:
+                return f.read(64).lstrip()[:1] == b'['
+        except OSError:
+            return False
+
+    def iter_records(self) -> Iterator[Any]:
+        """
+        Yield the items of a top-level JSON array one at a time, parsing the
+        file incrementally with ijson.
+
+        Raises:
+            ImportError: If ijson is not installed
+            ijson.JSONError: If the file is not valid JSON (e.g. NaN literals)
+        """
+        if not IJSON_AVAILABLE:
+            raise ImportError("The 'ijson' library is required for streaming JSON. Please install it via 'pip install ijson'.")
+        self.ensure_exists()
+        with open(self.file_path, 'rb') as f:
+            advise_sequential(f)
+            yield from ijson.items(f, 'item', use_float=True)
+
     def save(self, data: Any) -> None:
         """
         Save any JSON-serializable data to the file.
@@ -58,8 +171,38 @@ class JsonRepository(FileRepository):
     def _save(self, data: Any):
         """Internal save method used by CRUD operations."""
         self.ensure_directory_exists()
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        if not self.pretty:
+            content = _dumps_compact(data)
+            with self._atomic_path() as tmp_path:
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+            return
+
+        # Pretty files always come from the stdlib encoder, so their format
+        # (4-space indent, NaN literals) is the same whether orjson is installed
+        with self._atomic_path() as tmp_path:
+            # json.dump writes one small chunk per token, so buffer them
+            with open(tmp_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
+
+    def prettify(self, output_path: Optional[str] = None) -> str:
+        """
+        Write an indented copy of the file for reading by humans, e.g. of a
+        large file saved compact with pretty=False.
+
+        Args:
+            output_path: Where to write the copy. Defaults to the file
+                         itself, reformatted in place.
+
+        Returns:
+            The path written to
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        output_path = output_path or self.file_path
+        JsonRepository(output_path, pretty=True)._save(_loads(self.read_bytes()))
+        return output_path
 
     def update_dict(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -88,12 +231,23 @@ class JsonRepository(FileRepository):
         Returns:
             The record dictionary if found, else None.
         """
+        target = str(record_id)
+        if self._is_streamable():
+            try:
+                # Stops parsing as soon as the record is found
+                for record in self.iter_records():
+                    if isinstance(record, dict) and str(record.get('id')) == target:
+                        return record
+                return None
+            except ijson.JSONError:
+                pass  # e.g. NaN literals, fall back to a full read
+
         data = self.read_all()
         if not isinstance(data, list):
             return None
-            
+
         for record in data:
-            if isinstance(record, dict) and str(record.get('id')) == str(record_id):
+            if isinstance(record, dict) and str(record.get('id')) == target:
                 return record
         return None
 
@@ -115,13 +269,14 @@ class JsonRepository(FileRepository):
         self._save(current_data)
 
     def update(self, record_id: str, updates: Dict[str, Any]) -> bool:
+        target = str(record_id)
         data = self.read_all()
         if not isinstance(data, list):
             return False
 
         updated = False
         for i, record in enumerate(data):
-            if isinstance(record, dict) and str(record.get('id')) == str(record_id):
+            if isinstance(record, dict) and str(record.get('id')) == target:
                 data[i].update(updates)
                 updated = True
                 break
@@ -131,12 +286,13 @@ class JsonRepository(FileRepository):
         return updated
 
     def delete(self, record_id: str) -> bool:
+        target = str(record_id)
         data = self.read_all()
         if not isinstance(data, list):
             return False
 
         initial_len = len(data)
-        data = [r for r in data if not isinstance(r, dict) or str(r.get('id')) != str(record_id)]
+        data = [r for r in data if not isinstance(r, dict) or str(r.get('id')) != target]
         
         if len(data) < initial_len:
             self._save(data)
@@ -144,21 +300,31 @@ class JsonRepository(FileRepository):
         return False
 
     def get_schema_info(self) -> Dict[str, Any]:
-        """Get schema information including nested structures."""
+        """
+        Get schema information including nested structures. Large
+        collections are analyzed while streaming, one record at a time.
+        """
+        if self._is_streamable():
+            try:
+                return self._schema_info(self.iter_records(), is_collection=True)
+            except ijson.JSONError:
+                pass  # e.g. NaN literals, fall back to a full read
+
         data = self.read_all()
-        
+        return self._schema_info(data, is_collection=isinstance(data, list))
+
+    def _schema_info(self, data: Any, is_collection: bool) -> Dict[str, Any]:
+        """Build the schema info of a collection (any iterable of records) or of a single object."""
         all_fields = {}
         sample = None
         best_sample = None
         max_populated = 0
 
-        if isinstance(data, list):
+        if is_collection:
             for record in data:
                 if isinstance(record, dict):
-                    self._analyze_fields(record, all_fields)
-                    
-                    # Count populated fields (non-empty arrays/objects)
-                    populated = self._count_populated_fields(record)
+                    # Analyzing also counts the populated fields (non-empty arrays/objects)
+                    populated = self._analyze_fields(record, all_fields)
                     
                     if sample is None:
                         sample = record
@@ -179,38 +345,41 @@ class JsonRepository(FileRepository):
             "sample": best_sample if best_sample else sample
         }
     
-    def _count_populated_fields(self, obj: Dict[str, Any]) -> int:
-        """Count how many fields have meaningful data (non-empty)."""
-        count = 0
-        for value in obj.values():
+    def _analyze_fields(self, obj: Dict[str, Any], fields: Dict[str, Any]) -> int:
+        """
+        Recursively analyze fields and capture nested schemas.
+        Returns how many fields of obj have meaningful data (non-empty).
+        """
+        populated = 0
+        for key, value in obj.items():
             if isinstance(value, (list, dict)):
                 if value:  # Non-empty list or dict
-                    count += 1
+                    populated += 1
             elif value is not None:
-                count += 1
-        return count
+                populated += 1
 
-    def _analyze_fields(self, obj: Dict[str, Any], fields: Dict[str, Any]) -> None:
-        """Recursively analyze fields and capture nested schemas."""
-        for key, value in obj.items():
-            field_info = self._get_type_info(value)
-            
-            # Merge with existing field info if present
-            if key in fields:
-                existing = fields[key]
+            existing = fields.get(key)
+            if existing is None:
+                fields[key] = self._get_type_info(value)
+            # A field seen before only changes for a new array of objects, so
+            # other values are not analyzed again
+            elif (existing.get("type") == "array" and isinstance(value, list) and
+                  value and isinstance(value[0], dict)):
+                field_info = self._get_type_info(value)
                 # If both are arrays with nested schemas, merge them
-                if (field_info.get("type") == "array" and existing.get("type") == "array" and
-                    "nested" in field_info and "nested" in existing):
+                if "nested" in existing:
                     self._merge_fields(existing["nested"], field_info["nested"])
                 # If we found a non-empty array after an empty one, update it
-                elif (field_info.get("type") == "array" and "nested" in field_info and 
-                      existing.get("type") == "array" and "nested" not in existing):
+                else:
                     fields[key] = field_info
-            else:
-                fields[key] = field_info
+        return populated
 
     def _get_type_info(self, value: Any) -> Dict[str, Any]:
         """Get type information for a value."""
+        type_name = _SCALAR_TYPE_NAMES.get(type(value))
+        if type_name is not None:
+            return {"type": type_name}
+
         if isinstance(value, dict):
             nested = {}
             self._analyze_fields(value, nested)
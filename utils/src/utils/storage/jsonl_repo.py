@@ -1,25 +1,111 @@
 import json
 import os
-from typing import List, Dict, Any, Union
-from .base import FileRepository
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+from .base import FileRepository, IO_BUFFER_SIZE, SAVE_MANY_BATCH_SIZE, advise_sequential, iter_batches
+from .json_repo import ORJSON_AVAILABLE, _dumps_compact, _loads
 from utils import logger
 
+if ORJSON_AVAILABLE:
+    import orjson
+
+# Files up to this size are read in one call and split in C; larger ones are
+# streamed line by line to bound memory
+JSONL_BULK_READ_MAX_BYTES = 256 * 1024 * 1024
+
+# Records encoded and appended together by one write in add()
+JSONL_APPEND_BATCH_SIZE = 1024
+
+# Lines decoded together by one map call when reading; a chunk holding an
+# invalid line is decoded again line by line
+JSONL_PARSE_CHUNK_LINES = 10_000
+
+# Marks lines that failed to parse so they can be filtered out in bulk
+_INVALID_LINE = object()
+
+# Per file: the (mtime_ns, size) it was indexed at, for each record id the
+# (offset, length) of every line holding it, and the bytes taken by blanked
+# lines, so get_by_id, update and delete can seek to a record instead of
+# reading the whole file
+_ID_INDEX: Dict[str, Tuple[Tuple[int, int], Dict[str, List[Tuple[int, int]]], int]] = {}
+
+# Share of the file that lines blanked by delete may take before
+# the file is rewritten without them
+JSONL_COMPACT_DEAD_RATIO = 0.25
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _index_lines(index: Dict[str, List[Tuple[int, int]]], content: bytes) -> int:
+    """
+    Add the id -> (offset, length) spans of the JSONL lines in content to
+    index. Returns the bytes taken by blank lines.
+    """
+    dead_bytes = 0
+    start = 0
+    end = len(content)
+    while start < end:
+        newline = content.find(b'\n', start)
+        if newline == -1:
+            newline = end
+        line = content[start:newline]
+        if line and not line.isspace():
+            try:
+                record = _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                record = None
+            if isinstance(record, dict):
+                index.setdefault(str(record.get('id')), []).append((start, newline - start))
+        elif line:
+            dead_bytes += newline - start
+        start = newline + 1
+    return dead_bytes
+
+
+def _append_records(path: str, records: List[Any], line_lengths: Optional[List[int]] = None) -> None:
+    """
+    Append records to path as JSONL on an O_APPEND descriptor, one write per
+    JSONL_APPEND_BATCH_SIZE records, so each batch lands contiguously even
+    with other processes appending to the same file. The byte length of
+    each line is added to line_lengths when given.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        for batch in iter_batches(records, JSONL_APPEND_BATCH_SIZE):
+            lines = list(map(_dumps_line, batch))
+            if line_lengths is not None:
+                line_lengths.extend(map(len, lines))
+            content = memoryview(b''.join(lines))
+            while content:
+                # Only loops on a short write (e.g. interrupted by a signal)
+                content = content[os.write(fd, content):]
+    finally:
+        os.close(fd)
+
+
+def _dumps_line(record: Any) -> bytes:
+    """Encode one record as a compact JSONL line, the same with or without orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return _dumps_compact(record) + b'\n'
+
 class JsonlRepository(FileRepository):
     def read_all(self) -> List[Dict[str, Any]]:
-        data = []
         try:
             self.ensure_exists()
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                for i, line in enumerate(f, start=1):
-                    try:
-                        if line.strip():
-                            data.append(json.loads(line))
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Invalid JSON on line {i} in '{self.file_path}': {e}")
-                        continue
+            if os.path.getsize(self.file_path) <= JSONL_BULK_READ_MAX_BYTES:
+                with open(self.file_path, 'rb') as f:
+                    advise_sequential(f)
+                    data = self._parse_lines(f.read().splitlines())
+            else:
+                with open(self.file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    advise_sequential(f)
+                    data = self._parse_lines(f)
             logger.info(f"JSONL loaded successfully: {self.file_path}")
-            logger.debug(f"Total records loaded: {len(data)}")
+            logger.debug("Total records loaded: %d", len(data))
             return data
         except FileNotFoundError:
             logger.error(f"JSONL file not found: {self.file_path}")
@@ -28,15 +114,71 @@ class JsonlRepository(FileRepository):
             logger.exception(f"Error while loading JSONL '{self.file_path}': {e}")
             raise
 
+    def _parse_lines(self, lines) -> List[Dict[str, Any]]:
+        """
+        Decode JSONL lines, skipping blank lines and logging invalid ones.
+        Lines are decoded a chunk at a time with one map call. A chunk that
+        fails is decoded again without its whitespace-only lines, and only a
+        chunk holding an invalid line is redone line by line.
+        """
+        data: List[Dict[str, Any]] = []
+        line_number = 1
+        for chunk in iter_batches(lines, JSONL_PARSE_CHUNK_LINES):
+            try:
+                # Built apart from data, so a failing chunk leaves no partial records behind
+                decoded = list(map(_loads, filter(None, chunk)))
+            except json.JSONDecodeError:
+                decoded = None
+
+            if decoded is None:
+                # Most failing chunks only hold lines blanked by delete, so
+                # drop whitespace-only lines and decode in bulk again
+                lines_left = [line for line in chunk if line and not line.isspace()]
+                try:
+                    decoded = list(map(_loads, lines_left))
+                except json.JSONDecodeError:
+                    decoded = None
+
+            if decoded is None:
+                parsed = [
+                    self._parse_line(line, i)
+                    for i, line in enumerate(chunk, start=line_number)
+                    if line and not line.isspace()
+                ]
+                decoded = [record for record in parsed if record is not _INVALID_LINE]
+            data.extend(decoded)
+            line_number += len(chunk)
+        return data
+
+    def _parse_line(self, line: bytes, line_number: int) -> Any:
+        try:
+            return _loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON on line {line_number} in '{self.file_path}': {e}")
+            return _INVALID_LINE
+
     def add(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
         try:
             self.ensure_directory_exists()
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                if isinstance(data, list):
-                    for record in data:
-                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            path = os.path.abspath(self.file_path)
+            cached = _ID_INDEX.get(path)
+            if cached is not None and (not os.path.exists(path) or cached[0] != _file_signature(path)):
+                cached = None
+            records = data if isinstance(data, list) else [data]
+            line_lengths = [] if cached is not None else None
+            _append_records(self.file_path, records, line_lengths)
+            if cached is not None:
+                # Index only the new lines, if nobody else appended meanwhile
+                offset = cached[0][1]
+                signature = _file_signature(path)
+                if signature[1] == offset + sum(line_lengths):
+                    for record, length in zip(records, line_lengths):
+                        if isinstance(record, dict):
+                            cached[1].setdefault(str(record.get('id')), []).append((offset, length - 1))
+                        offset += length
+                    _ID_INDEX[path] = (signature, cached[1], cached[2])
                 else:
-                    f.write(json.dumps(data, ensure_ascii=False) + '\n')
+                    _ID_INDEX.pop(path, None)
             logger.info(f"Added data to JSONL: {self.file_path}")
         except Exception as e:
             logger.exception(f"Error while adding to JSONL '{self.file_path}': {e}")
@@ -45,43 +187,170 @@ class JsonlRepository(FileRepository):
     def save_all(self, data: List[Dict[str, Any]]):
         try:
             self.ensure_directory_exists()
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                for record in data:
-                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            with self._atomic_path() as tmp_path:
+                with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.writelines(_dumps_line(record) for record in data)
+            logger.info(f"JSONL content saved successfully to: {self.file_path}")
+        except Exception as e:
+            logger.exception(f"Error while saving JSONL '{self.file_path}': {e}")
+            raise
+
+    def save_many(self, records: Iterable[Dict[str, Any]], batch_size: int = SAVE_MANY_BATCH_SIZE) -> int:
+        """
+        Overwrite the file with records pulled from any iterable (e.g. a
+        generator), so only one batch is held in memory at a time.
+
+        Returns:
+            Number of records written
+        """
+        try:
+            self.ensure_directory_exists()
+            count = 0
+            with self._atomic_path() as tmp_path:
+                with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    for batch in iter_batches(records, batch_size):
+                        f.writelines(map(_dumps_line, batch))
+                        count += len(batch)
             logger.info(f"JSONL content saved successfully to: {self.file_path}")
+            logger.debug("Total records saved: %d", count)
+            return count
         except Exception as e:
             logger.exception(f"Error while saving JSONL '{self.file_path}': {e}")
             raise
 
+    def _id_index(self) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Return the id -> line spans index of the file, rebuilding it only if
+        the file's mtime or size changed since it was built.
+        """
+        path = os.path.abspath(self.file_path)
+        signature = _file_signature(path)
+        cached = _ID_INDEX.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index: Dict[str, List[Tuple[int, int]]] = {}
+        with open(path, 'rb') as f:
+            advise_sequential(f)
+            dead_bytes = _index_lines(index, f.read())
+        _ID_INDEX[path] = (signature, index, dead_bytes)
+        return index
+
+    def _commit_index(self, blanked_bytes: int, expected_size: Optional[int] = None) -> None:
+        """
+        Keep the index valid after editing lines in place, adding the bytes
+        just blanked. Compacts the file once blanked lines exceed
+        JSONL_COMPACT_DEAD_RATIO of it.
+        """
+        path = os.path.abspath(self.file_path)
+        cached = _ID_INDEX.get(path)
+        if cached is None:
+            return
+        signature = _file_signature(path)
+        if expected_size is not None and signature[1] != expected_size:
+            # Another writer appended meanwhile, rebuild on the next lookup
+            _ID_INDEX.pop(path, None)
+            return
+
+        dead_bytes = cached[2] + blanked_bytes
+        if dead_bytes > JSONL_COMPACT_DEAD_RATIO * signature[1]:
+            self.save_all(self.read_all())
+            _ID_INDEX.pop(path, None)
+            logger.info(f"Compacted JSONL: {self.file_path}")
+        else:
+            _ID_INDEX[path] = (signature, cached[1], dead_bytes)
+
+    def get_by_id(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a record by its 'id' field, reading only its line.
+
+        Returns:
+            The first record with this id, else None.
+        """
+        try:
+            self.ensure_exists()
+            spans = self._id_index().get(str(record_id))
+            if not spans:
+                return None
+            offset, length = spans[0]
+            with open(self.file_path, 'rb') as f:
+                f.seek(offset)
+                return _loads(f.read(length))
+        except Exception as e:
+            logger.exception(f"Error while reading from JSONL '{self.file_path}': {e}")
+            raise
+
     def update(self, record_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Update the first record with this id. The line is rewritten in place
+        (padded with spaces) when the updated record fits in it; otherwise
+        the whole file is rewritten, so records keep their order.
+        """
+        target = str(record_id)
         try:
-            data = self.read_all()
-            updated = False
-            for i, record in enumerate(data):
-                if str(record.get('id')) == str(record_id):
-                    data[i].update(updates)
-                    updated = True
-                    break
-            
-            if updated:
+            self.ensure_exists()
+            index = self._id_index()
+            spans = index.get(target)
+            if not spans:
+                return False
+
+            offset, length = spans[0]
+            size = _file_signature(self.file_path)[1]
+            with open(self.file_path, 'r+b') as f:
+                f.seek(offset)
+                record = _loads(f.read(length))
+                record.update(updates)
+                line = _dumps_line(record)
+                in_place = len(line) <= length + 1
+                if in_place:
+                    f.seek(offset)
+                    f.write(line[:-1].ljust(length))
+
+            if in_place:
+                new_id = str(record.get('id'))
+                if new_id != target:
+                    # The update changed the id, so its line now belongs to the new one
+                    span = spans.pop(0)
+                    if not spans:
+                        del index[target]
+                    new_spans = index.setdefault(new_id, [])
+                    new_spans.append(span)
+                    new_spans.sort()
+                self._commit_index(0, size)
+            else:
+                data = self.read_all()
+                for i, record in enumerate(data):
+                    if str(record.get('id')) == target:
+                        data[i].update(updates)
+                        break
                 self.save_all(data)
-                logger.info(f"Updated record {record_id} in {self.file_path}")
-            return updated
+            logger.info(f"Updated record {record_id} in {self.file_path}")
+            return True
         except Exception as e:
             logger.exception(f"Error while updating JSONL '{self.file_path}': {e}")
             raise
 
     def delete(self, record_id: str) -> bool:
+        """
+        Delete every record with this id by blanking its lines in place.
+        Readers skip blank lines, and they are dropped by the next save_all
+        or compaction.
+        """
+        target = str(record_id)
         try:
-            data = self.read_all()
-            initial_len = len(data)
-            data = [r for r in data if str(r.get('id')) != str(record_id)]
-            
-            if len(data) < initial_len:
-                self.save_all(data)
-                logger.info(f"Deleted record {record_id} from {self.file_path}")
-                return True
-            return False
+            self.ensure_exists()
+            index = self._id_index()
+            spans = index.pop(target, None)
+            if not spans:
+                return False
+
+            with open(self.file_path, 'r+b') as f:
+                for offset, length in spans:
+                    f.seek(offset)
+                    f.write(b' ' * length)
+            self._commit_index(sum(length for _, length in spans))
+            logger.info(f"Deleted record {record_id} from {self.file_path}")
+            return True
         except Exception as e:
             logger.exception(f"Error while deleting from JSONL '{self.file_path}': {e}")
             raise
@@ -89,16 +358,32 @@ class JsonlRepository(FileRepository):
     def save_from_bytes(self, content: bytes) -> None:
         """
         Parse raw bytes content into JSON objects and save them.
+        Content whose every line is valid JSON is written as is, without
+        re-encoding; otherwise invalid lines are dropped.
         """
         self.ensure_directory_exists()
         try:
-            logs_str = content.decode('utf-8')
+            lines = content.splitlines()
+            try:
+                count = sum(1 for _ in map(_loads, filter(None, lines)))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                count = None
+
+            if count is not None:
+                with self._atomic_path() as tmp_path:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(content)
+                        if content and not content.endswith(b'\n'):
+                            f.write(b'\n')
+                logger.info(f"Saved {count} records from bytes to {self.file_path}")
+                return
+
             data = []
-            for line in logs_str.splitlines():
+            for line in lines:
                 if line.strip():
                     try:
-                        data.append(json.loads(line))
-                    except json.JSONDecodeError:
+                        data.append(_loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
             
             self.save_all(data)
@@ -114,10 +399,11 @@ class JsonlRepository(FileRepository):
         """
         try:
             self.ensure_exists()
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline()
-                if first_line.strip():
-                    data = json.loads(first_line)
+            with open(self.file_path, 'rb') as f:
+                # Skip lines blanked by delete
+                first_line = next((line for line in f if not line.isspace()), b'')
+                if first_line:
+                    data = _loads(first_line)
                     if isinstance(data, dict):
                         return {
                             "fields": list(data.keys()),
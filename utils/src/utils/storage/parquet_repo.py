@@ -0,0 +1,105 @@
+from typing import List, Dict, Any, Union
+from .base import FileRepository
+from ..logger import logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Compression codec for written files
+PARQUET_COMPRESSION = "zstd"
+
+class ParquetRepository(FileRepository):
+    """
+    Repository for Parquet files, read and written column-wise by pyarrow.
+    Prefer it over CSV/JSONL for large tabular datasets (100k+ rows), which
+    then skip text parsing entirely.
+    """
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        if not PYARROW_AVAILABLE:
+            raise ImportError("The 'pyarrow' library is required for Parquet support. Please install it via 'pip install pyarrow'.")
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        self.ensure_exists()
+        try:
+            data = pq.read_table(self.file_path).to_pylist()
+            logger.info(f"Parquet loaded successfully: {self.file_path}")
+            return data
+        except Exception as e:
+            logger.exception(f"Error while loading Parquet '{self.file_path}': {e}")
+            raise
+
+    def save_all(self, data: Union[List[Dict[str, Any]], Any]) -> None:
+        """
+        Overwrite the file with a list of records or a pandas DataFrame.
+        """
+        try:
+            self.ensure_directory_exists()
+            if isinstance(data, list):
+                table = pa.Table.from_pylist(data)
+            else:
+                table = pa.Table.from_pandas(data, preserve_index=False)
+            with self._atomic_path() as tmp_path:
+                pq.write_table(table, tmp_path, compression=PARQUET_COMPRESSION)
+            logger.info(f"Parquet content saved successfully to: {self.file_path}")
+        except Exception as e:
+            logger.exception(f"Error while saving Parquet '{self.file_path}': {e}")
+            raise
+
+    def add(self, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        current_data = self.read_all()
+        if isinstance(data, list):
+            current_data.extend(data)
+        else:
+            current_data.append(data)
+        self.save_all(current_data)
+
+    def update(self, record_id: str, updates: Dict[str, Any]) -> bool:
+        target = str(record_id)
+        data = self.read_all()
+        updated = False
+        for i, record in enumerate(data):
+            if str(record.get('id')) == target:
+                data[i].update(updates)
+                updated = True
+                break
+
+        if updated:
+            self.save_all(data)
+        return updated
+
+    def delete(self, record_id: str) -> bool:
+        target = str(record_id)
+        data = self.read_all()
+        initial_len = len(data)
+        data = [r for r in data if str(r.get('id')) != target]
+
+        if len(data) < initial_len:
+            self.save_all(data)
+            return True
+        return False
+
+    def get_schema_info(self) -> Dict[str, Any]:
+        """
+        Get schema information about the Parquet file.
+        Returns column names as 'fields', Arrow types as 'schema', and the first row as 'sample'.
+        Only the footer and the first row are read.
+        """
+        try:
+            self.ensure_exists()
+            parquet_file = pq.ParquetFile(self.file_path)
+            schema = parquet_file.schema_arrow
+            first_batch = next(parquet_file.iter_batches(batch_size=1), None)
+            rows = first_batch.to_pylist() if first_batch is not None else []
+            return {
+                "fields": schema.names,
+                "schema": {field.name: {"type": str(field.type)} for field in schema},
+                "sample": rows[0] if rows else None
+            }
+        except Exception:
+            return {"fields": [], "schema": {}, "sample": None}
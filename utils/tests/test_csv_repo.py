@@ -0,0 +1,128 @@
+import csv
+import os
+
+import pytest
+
+from utils import CsvRepository
+
+
+def _records(count):
+    return [{"id": i, "name": f"user {i}", "active": True, "score": 1.0} for i in range(count)]
+
+
+def _stdlib_csv(path, records):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(records[0].keys())
+        writer.writerows([list(record.values()) for record in records])
+    return path.read_bytes()
+
+
+def test_save_format_does_not_depend_on_row_count(tmp_path):
+    small = CsvRepository(str(tmp_path / "small.csv"))
+    large = CsvRepository(str(tmp_path / "large.csv"))
+    small.save_all(_records(999))
+    large.save_all(_records(1000))
+
+    small_lines = (tmp_path / "small.csv").read_bytes().splitlines()
+    large_lines = (tmp_path / "large.csv").read_bytes().splitlines()
+    assert large_lines[:1000] == small_lines
+    assert small_lines[0] == b"id,name,active,score"
+    assert small_lines[1] == b"0,user 0,True,1.0"
+
+
+def test_save_matches_csv_writer(tmp_path):
+    records = _records(1500)
+    CsvRepository(str(tmp_path / "repo.csv")).save_all(records)
+    assert (tmp_path / "repo.csv").read_bytes() == _stdlib_csv(tmp_path / "ref.csv", records)
+
+
+def test_read_all_returns_strings_for_any_size(tmp_path):
+    for count in (10, 20000):
+        repo = CsvRepository(str(tmp_path / f"{count}.csv"))
+        repo.save_all(_records(count))
+        rows = repo.read_all()
+        assert len(rows) == count
+        assert rows[-1] == {"id": str(count - 1), "name": f"user {count - 1}", "active": "True", "score": "1.0"}
+
+
+def test_ensure_exists_notices_a_removed_file(tmp_path):
+    path = tmp_path / "users.csv"
+    repo = CsvRepository(str(path))
+    repo.save_all(_records(3))
+    repo.ensure_exists()
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        repo.ensure_exists()
+
+
+@pytest.fixture
+def indexed(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_bytes(
+        b'id,name,note\r\n'
+        b'1,ann,plain\r\n'
+        b'2,bob,"two\r\nlines, and ""quotes"""\r\n'
+        b'3,cy,plain\r\n'
+        b'1,dup,second row with id 1\r\n'
+    )
+    return CsvRepository(str(path))
+
+
+def test_row_index_follows_quoted_line_breaks(indexed):
+    content = open(indexed.file_path, "rb").read()
+    index = indexed._row_index()
+    assert set(index) == {"1", "2", "3"}
+    for record_id, prefix in (("1", b"1,ann,"), ("2", b"2,bob,"), ("3", b"3,cy,")):
+        offset, length = index[record_id]
+        assert content[offset:offset + length].startswith(prefix)
+        assert content[offset + length - 2:offset + length] == b"\r\n"
+
+
+def test_update_of_the_same_length_is_written_in_place(indexed):
+    index = indexed._row_index()
+    assert indexed.update(3, {"name": "di"})
+    assert indexed._row_index() is index
+    assert [record["name"] for record in indexed.read_all()] == ["ann", "bob", "di", "dup"]
+
+
+def test_update_after_a_multiline_row(indexed):
+    assert indexed.update("3", {"note": "now longer than before"})
+    records = indexed.read_all()
+    assert [record["id"] for record in records] == ["1", "2", "3", "1"]
+    assert records[1]["note"] == 'two\r\nlines, and "quotes"'
+    assert records[2]["note"] == "now longer than before"
+
+
+def test_update_changes_only_the_first_row_with_the_id(indexed):
+    assert indexed.update(1, {"name": "eve"})
+    assert [record["name"] for record in indexed.read_all()] == ["eve", "bob", "cy", "dup"]
+
+
+def test_update_can_change_the_id(indexed):
+    assert indexed.update(3, {"id": "4"})
+    assert not indexed.update(3, {"name": "x"})
+    assert indexed.update(4, {"name": "x"})
+    assert [record["id"] for record in indexed.read_all()] == ["1", "2", "4", "1"]
+
+
+def test_misses_leave_the_file_untouched(indexed):
+    before = os.stat(indexed.file_path).st_mtime_ns
+    assert not indexed.update(9, {"name": "x"})
+    assert not indexed.delete(9)
+    assert os.stat(indexed.file_path).st_mtime_ns == before
+
+
+def test_delete_removes_every_row_with_the_id(indexed):
+    assert indexed.delete(1)
+    assert [record["id"] for record in indexed.read_all()] == ["2", "3"]
+    assert not indexed.delete(1)
+
+
+def test_row_index_is_rebuilt_after_an_outside_write(indexed):
+    indexed._row_index()
+    with open(indexed.file_path, "ab") as f:
+        f.write(b"5,fay,added outside\r\n")
+    assert indexed.update(5, {"name": "gus"})
+    assert indexed.read_all()[-1]["name"] == "gus"
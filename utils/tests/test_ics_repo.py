@@ -0,0 +1,108 @@
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("icalendar")
+
+from utils import IcsRepository
+
+EVENTS = [
+    {"id": "a", "summary": "Maths", "description": "Room 1", "start": "2025-03-10T09:00:00", "end": "2025-03-10T10:00:00"},
+    {"id": "b", "summary": "Physics", "description": "", "start": "2025-03-10T11:00:00", "end": "2025-03-10T12:00:00"},
+]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = IcsRepository(str(tmp_path / "calendar.ics"))
+    repository.save_all(EVENTS[:1])
+    return repository
+
+
+def test_add_inserts_events_before_the_calendar_end(repo):
+    repo.add(EVENTS[1])
+    content = open(repo.file_path, "rb").read()
+    assert content.rstrip().endswith(b"END:VCALENDAR")
+    assert [event["id"] for event in repo.read_all()] == ["a", "b"]
+    assert os.listdir(os.path.dirname(repo.file_path)) == ["calendar.ics"]
+
+
+def test_interrupted_add_leaves_the_calendar_intact(repo, monkeypatch):
+    before = open(repo.file_path, "rb").read()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copyfileobj", fail)
+    with pytest.raises(OSError):
+        repo.add(EVENTS[1])
+    assert open(repo.file_path, "rb").read() == before
+    assert os.listdir(os.path.dirname(repo.file_path)) == ["calendar.ics"]
+
+
+# Scanner and icalendar must agree on every calendar the scanner accepts
+
+from utils.src.utils.storage.ics_repo import _UnsupportedCalendar, _scan_events
+
+
+def _calendar(*events):
+    body = "".join(f"BEGIN:VEVENT\r\n{event}END:VEVENT\r\n" for event in events)
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//test//EN\r\n{body}END:VCALENDAR\r\n"
+
+
+SCANNED_CALENDARS = {
+    "utc": _calendar("UID:1\r\nSUMMARY:Maths\r\nDTSTART:20250310T090000Z\r\nDTEND:20250310T100000Z\r\n"),
+    "floating": _calendar("UID:2\r\nSUMMARY:Maths\r\nDTSTART:20250310T090000\r\nDTEND:20250310T100000\r\n"),
+    "tzid": _calendar(
+        "UID:3\r\nSUMMARY:Maths\r\nDTSTART;TZID=Europe/Paris:20250710T090000\r\n"
+        "DTEND;TZID=Europe/Paris:20250710T100000\r\n"
+    ),
+    "date": _calendar("UID:4\r\nSUMMARY:Holiday\r\nDTSTART;VALUE=DATE:20250714\r\nDTEND;VALUE=DATE:20250715\r\n"),
+    "folded": _calendar(
+        "UID:5\r\nSUMMARY:A long\r\n  summary folded\r\n\tover lines\r\nDESCRIPTION:Line one\r\n  and more\r\n"
+        "DTSTART:20250310T090000Z\r\n"
+    ),
+    "escaped_text": _calendar(
+        "UID:6\r\nSUMMARY:Maths\\, algebra\\; room 2\r\nDESCRIPTION:First\\nSecond\\\\Third\r\n"
+        "DTSTART:20250310T090000Z\r\n"
+    ),
+    "quoted_parameter": _calendar(
+        'UID:7\r\nSUMMARY;ALTREP="http://example.com:80/x":Maths\r\nDTSTART:20250310T090000Z\r\n'
+    ),
+    "lowercase_and_lf": _calendar("uid:8\nsummary:Maths\ndtstart:20250310T090000Z\n").replace("\r\n", "\n"),
+    "alarm_inside_event": _calendar(
+        "UID:9\r\nSUMMARY:Maths\r\nDTSTART:20250310T090000Z\r\n"
+        "BEGIN:VALARM\r\nACTION:DISPLAY\r\nDESCRIPTION:Reminder\r\nTRIGGER:-PT15M\r\nEND:VALARM\r\n"
+    ),
+    "missing_fields": _calendar("DTEND:20250310T100000Z\r\n"),
+    "several_events": _calendar(
+        "UID:10\r\nSUMMARY:First\r\nDTSTART:20250310T090000Z\r\n",
+        "UID:11\r\nSUMMARY:Second\r\nDTSTART:20250311T090000Z\r\nDESCRIPTION:\r\n",
+    ),
+}
+
+
+@pytest.mark.parametrize("text", SCANNED_CALENDARS.values(), ids=SCANNED_CALENDARS.keys())
+def test_scanner_matches_icalendar(text):
+    assert _scan_events(text) == IcsRepository._parse_with_icalendar(text.encode("utf-8"))
+
+
+UNSUPPORTED_CALENDARS = {
+    "duplicate_property": _calendar("UID:1\r\nSUMMARY:A\r\nSUMMARY:B\r\n"),
+    "unknown_tzid": _calendar("UID:2\r\nDTSTART;TZID=Custom/Zone:20250310T090000\r\n"),
+    "unterminated": "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:3\r\n",
+    "truncated_datetime": _calendar("UID:4\r\nDTSTART:20250310T0900\r\n"),
+}
+
+
+@pytest.mark.parametrize("text", UNSUPPORTED_CALENDARS.values(), ids=UNSUPPORTED_CALENDARS.keys())
+def test_scanner_leaves_unsupported_input_to_icalendar(text):
+    with pytest.raises(_UnsupportedCalendar):
+        _scan_events(text)
+
+
+def test_read_all_falls_back_to_icalendar(tmp_path):
+    path = tmp_path / "calendar.ics"
+    path.write_text(UNSUPPORTED_CALENDARS["duplicate_property"], encoding="utf-8")
+    assert IcsRepository(str(path)).read_all()[0]["id"] == "1"
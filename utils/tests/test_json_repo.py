@@ -0,0 +1,89 @@
+import json
+import math
+
+import pytest
+
+from utils import JsonRepository, JsonlRepository
+from utils.src.utils.storage import json_repo, jsonl_repo
+
+RECORDS = [
+    {"id": 1, "name": "Émile", "score": 0.5, "tags": ["a", "b"], "meta": {"ok": True, "none": None}},
+    {"id": 2, "name": "Zoé", "score": 12.0, "tags": [], "meta": {}},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_available(request, monkeypatch):
+    if request.param and not json_repo.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_repo, "ORJSON_AVAILABLE", request.param)
+    monkeypatch.setattr(jsonl_repo, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+def test_pretty_save_matches_stdlib_indent(tmp_path, orjson_available):
+    path = tmp_path / "data.json"
+    JsonRepository(str(path)).save_all(RECORDS)
+    assert path.read_text(encoding="utf-8") == json.dumps(RECORDS, indent=4, ensure_ascii=False)
+
+
+def test_pretty_save_keeps_nan_literals(tmp_path, orjson_available):
+    path = tmp_path / "data.json"
+    repo = JsonRepository(str(path))
+    repo.save_all([{"id": 1, "score": float("nan")}])
+    assert "NaN" in path.read_text(encoding="utf-8")
+    assert math.isnan(repo.read_all()[0]["score"])
+
+
+def test_compact_save_is_the_same_with_and_without_orjson(tmp_path, orjson_available):
+    path = tmp_path / "data.json"
+    repo = JsonRepository(str(path), pretty=False)
+    repo.save_all(RECORDS)
+    assert path.read_bytes() == json.dumps(RECORDS, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    assert repo.read_all() == RECORDS
+
+
+def test_compact_save_writes_non_finite_floats_as_null(tmp_path, orjson_available):
+    path = tmp_path / "data.json"
+    JsonRepository(str(path), pretty=False).save_all([{"a": float("nan"), "b": [float("inf")]}])
+    assert path.read_bytes() == b'[{"a":null,"b":[null]}]'
+
+
+def test_jsonl_lines_are_the_same_with_and_without_orjson(tmp_path, orjson_available):
+    path = tmp_path / "data.jsonl"
+    repo = JsonlRepository(str(path))
+    repo.save_all(RECORDS)
+    expected = b"".join(
+        json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n" for record in RECORDS
+    )
+    assert path.read_bytes() == expected
+    assert repo.read_all() == RECORDS
+
+
+def test_prettify_writes_an_indented_copy(tmp_path):
+    path = tmp_path / "data.json"
+    repo = JsonRepository(str(path), pretty=False)
+    repo.save_all(RECORDS)
+    copy_path = repo.prettify(str(tmp_path / "pretty.json"))
+    assert (tmp_path / "pretty.json").read_text(encoding="utf-8") == json.dumps(RECORDS, indent=4, ensure_ascii=False)
+    assert copy_path == str(tmp_path / "pretty.json")
+
+
+def test_save_recreates_a_removed_directory(tmp_path):
+    folder = tmp_path / "data"
+    repository = JsonRepository(str(folder / "records.json"))
+    repository.save_all(RECORDS)
+
+    (folder / "records.json").unlink()
+    folder.rmdir()
+    repository.save_all(RECORDS)
+    assert repository.read_all() == RECORDS
+
+
+def test_relative_directory_is_created_in_each_working_directory(tmp_path, monkeypatch):
+    for name in ("first", "second"):
+        cwd = tmp_path / name
+        cwd.mkdir()
+        monkeypatch.chdir(cwd)
+        JsonRepository("data/records.json").save_all(RECORDS)
+        assert (cwd / "data" / "records.json").exists()
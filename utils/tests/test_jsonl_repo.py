@@ -0,0 +1,143 @@
+import os
+import random
+
+import pytest
+
+from utils import JsonlRepository
+from utils.src.utils.storage import jsonl_repo
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = JsonlRepository(str(tmp_path / "data.jsonl"))
+    repository.save_all([{"id": i, "value": "x"} for i in range(5)])
+    return repository
+
+
+def _ids(repository):
+    return [record["id"] for record in repository.read_all()]
+
+
+def test_get_by_id_reads_the_indexed_line(repo):
+    assert repo.get_by_id(3) == {"id": 3, "value": "x"}
+    assert repo.get_by_id("3") == {"id": 3, "value": "x"}
+    assert repo.get_by_id(99) is None
+
+
+def test_update_that_fits_is_padded_in_place(repo):
+    size = os.path.getsize(repo.file_path)
+    assert repo.update(1, {"value": ""})
+    assert os.path.getsize(repo.file_path) == size
+    assert repo.read_all()[1] == {"id": 1, "value": ""}
+    assert repo.get_by_id(1) == {"id": 1, "value": ""}
+
+
+def test_update_that_grows_keeps_record_order(repo):
+    assert repo.update(1, {"value": "a much longer value than before"})
+    assert _ids(repo) == [0, 1, 2, 3, 4]
+    assert repo.get_by_id(1)["value"] == "a much longer value than before"
+
+
+def test_update_can_change_the_id(repo):
+    assert repo.update(2, {"id": 7})
+    assert repo.get_by_id(2) is None
+    assert repo.get_by_id(7) == {"id": 7, "value": "x"}
+    assert _ids(repo) == [0, 1, 7, 3, 4]
+
+
+def test_delete_blanks_lines_that_readers_skip(repo):
+    assert repo.delete(2)
+    assert not repo.delete(2)
+    assert _ids(repo) == [0, 1, 3, 4]
+    assert repo.get_by_id(2) is None
+    assert repo.get_schema_info()["fields"] == ["id", "value"]
+
+
+def test_delete_of_the_first_line_keeps_schema_info(repo):
+    assert repo.delete(0)
+    assert repo.get_schema_info()["sample"] == {"id": 1, "value": "x"}
+
+
+def test_blanked_lines_are_compacted(tmp_path):
+    repository = JsonlRepository(str(tmp_path / "data.jsonl"))
+    repository.save_all([{"id": i} for i in range(100)])
+    for i in range(30):
+        repository.delete(i)
+    # Past JSONL_COMPACT_DEAD_RATIO the file was rewritten without blank lines
+    lines = open(repository.file_path, "rb").read().splitlines()
+    blank = sum(line.isspace() for line in lines)
+    assert blank < 30
+    assert len(lines) == 70 + blank
+    assert _ids(repository) == list(range(30, 100))
+
+
+def test_add_extends_the_index(repo):
+    repo.get_by_id(0)
+    repo.add([{"id": 10, "value": "y"}, {"id": 11, "value": "z"}])
+    assert repo.get_by_id(11) == {"id": 11, "value": "z"}
+    assert repo.update(10, {"value": "w"})
+    assert repo.read_all()[-2:] == [{"id": 10, "value": "w"}, {"id": 11, "value": "z"}]
+
+
+def test_index_is_rebuilt_after_an_outside_write(repo):
+    repo.get_by_id(0)
+    with open(repo.file_path, "ab") as f:
+        f.write(b'{"id": 42, "value": "outside"}\n')
+    assert repo.get_by_id(42) == {"id": 42, "value": "outside"}
+
+
+def test_parse_chunks_with_blank_and_invalid_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(jsonl_repo, "JSONL_PARSE_CHUNK_LINES", 3)
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b'{"id":1}\n   \n{"id":2}\n{bad\n{"id":3}\n\n{"id":4}\n')
+    assert _ids(JsonlRepository(str(path))) == [1, 2, 3, 4]
+
+
+def test_random_operations_match_a_list(tmp_path):
+    rng = random.Random(1)
+    repository = JsonlRepository(str(tmp_path / "data.jsonl"))
+    expected = [{"id": i, "value": "x" * (i % 7)} for i in range(300)]
+    repository.save_all(expected)
+    next_id = 300
+    for _ in range(1500):
+        choice = rng.random()
+        record_id = rng.randrange(next_id)
+        position = next((i for i, r in enumerate(expected) if r["id"] == record_id), None)
+        if choice < 0.3:
+            assert repository.get_by_id(record_id) == (expected[position] if position is not None else None)
+        elif choice < 0.6:
+            updates = {"value": "y" * rng.randrange(12)}
+            assert repository.update(record_id, updates) == (position is not None)
+            if position is not None:
+                expected[position].update(updates)
+        elif choice < 0.8:
+            assert repository.delete(record_id) == (position is not None)
+            if position is not None:
+                del expected[position]
+        else:
+            expected.append({"id": next_id, "value": "z"})
+            repository.add(expected[-1])
+            next_id += 1
+    assert repository.read_all() == expected
+
+
+def test_index_is_built_once_per_file_version(repo, monkeypatch):
+    calls = []
+    index_lines = jsonl_repo._index_lines
+    monkeypatch.setattr(jsonl_repo, "_index_lines", lambda *args: calls.append(1) or index_lines(*args))
+    jsonl_repo._ID_INDEX.clear()
+    for record_id in range(5):
+        repo.get_by_id(record_id)
+    repo.update(1, {"value": ""})
+    repo.delete(2)
+    assert len(calls) == 1
+
+
+def test_duplicate_ids(tmp_path):
+    repository = JsonlRepository(str(tmp_path / "data.jsonl"))
+    repository.save_all([{"id": 1, "n": 0}, {"id": 2, "n": 1}, {"id": 1, "n": 2}])
+    assert repository.get_by_id(1) == {"id": 1, "n": 0}
+    assert repository.update(1, {"n": 9})
+    assert [record["n"] for record in repository.read_all()] == [9, 1, 2]
+    assert repository.delete(1)
+    assert repository.read_all() == [{"id": 2, "n": 1}]
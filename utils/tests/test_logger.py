@@ -0,0 +1,25 @@
+import logging
+
+from utils import logger
+
+
+def test_caller_path_is_set_without_replacing_the_record_factory():
+    assert logging.getLogRecordFactory() is logging.LogRecord
+
+    records = []
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    handler = Capture()
+    for existing in logger.handlers:
+        for log_filter in existing.filters:
+            handler.addFilter(log_filter)
+    logger.addHandler(handler)
+    try:
+        logger.info("hello")
+    finally:
+        logger.removeHandler(handler)
+
+    assert records[0].caller_path == "utils/tests/test_logger.py"
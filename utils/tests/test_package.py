@@ -0,0 +1,9 @@
+import subprocess
+import sys
+
+
+def test_import_loads_the_env_file_before_anything_else():
+    # load_config reads environment overrides, so .env must already be loaded
+    code = "import sys, utils; print('utils.src.utils.Secrets' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "True"
@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+
+from utils import decode_session_dtos, map_to_session_dto, map_to_session_dtos
+
+SESSIONS = [
+    {
+        "session_id": 1,
+        "device_id": "d1",
+        "session_context": "Lecture",
+        "matched_sessions": [{"id": "e1", "summary": "Math", "start": "2025-01-02T09:00:00", "end": "2025-01-02T10:00:00"}],
+        "received_at": "2025-01-02T10:05:00",
+        "logs_date": "2025-01-02",
+        "recorded_count": 3,
+        "unique_count": 2,
+        "redundant_uids": {"a1": 1},
+        "logs": [{"uid": "a1", "ts": "09:01:00"}, {"uid": "b2", "ts": "09:02:00"}],
+    },
+    {"session_id": 2, "device_id": "d2", "received_at": None, "logs_date": "2025-01-03"},
+    {"session_id": 3},
+]
+
+
+def test_batch_and_single_mapping_agree():
+    assert map_to_session_dtos(SESSIONS) == [map_to_session_dto(session) for session in SESSIONS]
+
+
+def test_received_at_falls_back_to_logs_date():
+    first, second, third = map_to_session_dtos(SESSIONS)
+    assert first.received_at == datetime(2025, 1, 2, 10, 5)
+    assert second.received_at == datetime(2025, 1, 3)
+    assert third.received_at is None
+    assert [(log.uid, log.ts) for log in first.logs] == [("a1", "09:01:00"), ("b2", "09:02:00")]
+    assert first.matched_sessions[0].start == datetime(2025, 1, 2, 9)
+
+
+def test_single_mapping_keeps_alerts():
+    dto = map_to_session_dto(SESSIONS[0], alert_count=1, alerts=[{"reason": "x"}])
+    assert (dto.alert_count, dto.alerts) == (1, [{"reason": "x"}])
+
+
+def test_decode_matches_the_mappers():
+    assert decode_session_dtos(json.dumps(SESSIONS[:2]).encode()) == map_to_session_dtos(SESSIONS[:2])